@@ -327,6 +327,8 @@ Feature: Cliplin CLI Tool
       | docs/rules/new-rule.md | New | Would add |
       | docs/rules/existing-rule.md | Modified | Would update |
       | docs/rules/unchanged-rule.md | Unchanged | Would skip |
+    And the report should list at most 200 files by default, ending with a "... N more" row for the rest
+    And `--limit <n>` should change that cap, with `--limit 0` listing every file
     And the CLI should not make any changes to the context store
     And the CLI should display a summary of what would be reindexed
 
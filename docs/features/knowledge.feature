@@ -32,7 +32,7 @@ Feature: Cliplin Knowledge Package Manager
     When I run `cliplin knowledge add <name> <source> <version>`
     Then the CLI should add an entry to the `knowledge` section in `cliplin.yaml` with the given name, source, and version
     And the CLI should create the package directory under `.cliplin/knowledge/` with the naming convention `<name>-<source_normalized>`
-    And the CLI should clone the repository using git sparse checkout so only relevant paths (e.g. docs/adrs, docs/rules, docs/business, docs/features, rules, skills) are materialized
+    And the CLI should fetch the repository into the shared source cache and extract only relevant paths (e.g. docs/adrs, docs/rules, docs/business, docs/features, rules, skills) into the package directory
     And the CLI should trigger reindexing for the newly added package so its documents are indexed into the context store (business-and-architecture, rules, features, uisi as per file type)
     And the CLI should display a success message
     And if the host integration supports skills (e.g. Claude Desktop), the CLI should expose package skills (e.g. via hard links under `.claude/skills`) so they appear installed to the host
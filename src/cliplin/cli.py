@@ -1,40 +1,94 @@
 """Main CLI entry point for Cliplin."""
 
+import importlib
+import os
+import shutil
+import subprocess
 import sys
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
+import click
 import typer
-from rich.console import Console
-
-from cliplin import __version__
-from cliplin.commands.init import init_command
-from cliplin.commands.validate import validate_command
-from cliplin.commands.reindex import reindex_command
-from cliplin.commands.feature import feature_apply_command
-from cliplin.commands.tool import tool_command
-from cliplin.commands.adr import adr_generate_command
-from cliplin.commands.knowledge import (
-    knowledge_add_command,
-    knowledge_install_command,
-    knowledge_list_command,
-    knowledge_remove_command,
-    knowledge_show_command,
-    knowledge_update_command,
-)
-from cliplin.commands.mcp import mcp_command
+from typer.core import TyperGroup
+from typer.main import get_command, get_group
+
+# Subcommands are imported only when resolved, so e.g. `cliplin --version` never loads
+# ChromaDB or the MCP server. Commands: name -> (module, attribute).
+LAZY_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "init": ("cliplin.commands.init", "init_command"),
+    "validate": ("cliplin.commands.validate", "validate_command"),
+    "reindex": ("cliplin.commands.reindex", "reindex_command"),
+    "mcp": ("cliplin.commands.mcp", "mcp_command"),
+    "tool": ("cliplin.commands.tool", "tool_command"),
+}
+
+# Subcommand groups: name -> (help, module, {subcommand: attribute}).
+LAZY_GROUPS: Dict[str, Tuple[str, str, Dict[str, str]]] = {
+    "feature": (
+        "Feature-related commands",
+        "cliplin.commands.feature",
+        {"apply": "feature_apply_command"},
+    ),
+    "adr": (
+        "ADR-related commands",
+        "cliplin.commands.adr",
+        {"generate": "adr_generate_command"},
+    ),
+    "knowledge": (
+        "Manage knowledge packages (ADRs, rules, features, etc.)",
+        "cliplin.commands.knowledge",
+        {
+            "list": "knowledge_list_command",
+            "add": "knowledge_add_command",
+            "remove": "knowledge_remove_command",
+            "update": "knowledge_update_command",
+            "show": "knowledge_show_command",
+            "install": "knowledge_install_command",
+        },
+    ),
+}
+
+
+def load_command(name: str) -> click.Command:
+    """Import the module behind a subcommand (or group) and build its click command."""
+    if name in LAZY_GROUPS:
+        help_text, module_name, commands = LAZY_GROUPS[name]
+        sub_app = typer.Typer(name=name, help=help_text, add_completion=False)
+    else:
+        module_name, attr = LAZY_COMMANDS[name]
+        commands = {name: attr}
+        sub_app = typer.Typer(add_completion=False)
+    module = importlib.import_module(module_name)
+    for command_name, attr in commands.items():
+        sub_app.command(name=command_name)(getattr(module, attr))
+    if name in LAZY_GROUPS:
+        return get_group(sub_app)
+    return get_command(sub_app)
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root group that resolves LAZY_COMMANDS / LAZY_GROUPS on first use."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(super().list_commands(ctx)) + [
+            name for name in (*LAZY_COMMANDS, *LAZY_GROUPS) if name not in self.commands
+        ]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and (cmd_name in LAZY_COMMANDS or cmd_name in LAZY_GROUPS):
+            self.commands[cmd_name] = load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 app = typer.Typer(
     name="cliplin",
     help="Cliplin CLI - Initialize and manage Cliplin projects for AI-assisted development",
     add_completion=False,
+    cls=LazyTyperGroup,
 )
 
-console = Console()
-
-
-def print_cliplin_banner() -> None:
-    """Display Cliplin ASCII art banner."""
-    banner = """
+BANNER = """
     ╔═══════════════════════════════════════════════╗
     ║                                               ║
     ║   ██████╗██╗     ██╗██████╗ ██╗     ██╗███╗   ██╗
@@ -46,31 +100,53 @@ def print_cliplin_banner() -> None:
     ║                                               ║
     ╚═══════════════════════════════════════════════╝
     """
-    console.print(f"[bold cyan]{banner}[/bold cyan]")
+
+# Rendered once at import: writing pre-built ANSI skips Rich markup parsing on every invocation.
+_BANNER_ANSI = f"\x1b[1;36m{BANNER}\x1b[0m\n"
+
+
+def print_cliplin_banner() -> None:
+    """Display Cliplin ASCII art banner."""
+    sys.stdout.write(_BANNER_ANSI)
+
+
+@lru_cache(maxsize=None)
+def get_uv_version() -> Optional[str]:
+    """Return `uv --version` output, or None if uv is not on PATH or fails. Cached per process."""
+    uv_path = shutil.which("uv")
+    if uv_path is None:
+        return None
+    try:
+        result = subprocess.run(
+            [uv_path, "--version"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=1,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
 
 
 def version_callback(value: bool) -> None:
     """Display version information."""
     if value:
+        from rich.console import Console
+
+        from cliplin import __version__
+
+        console = Console()
         console.print(f"[bold green]cliplin[/bold green] version [cyan]{__version__}[/cyan]")
         console.print(f"Python version: [cyan]{sys.version.split()[0]}[/cyan]")
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["uv", "--version"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                console.print(f"uv version: [cyan]{result.stdout.strip()}[/cyan]")
-        except Exception:
-            pass
+        uv_version = get_uv_version()
+        if uv_version:
+            console.print(f"uv version: [cyan]{uv_version}[/cyan]")
         raise typer.Exit()
 
 
 @app.callback()
-def main(
+def app_callback(
     version: Optional[bool] = typer.Option(
         None,
         "--version",
@@ -83,47 +159,19 @@ def main(
     # When running as MCP server (stdio), do not print banner or anything to stdout
     if len(sys.argv) >= 2 and sys.argv[1] == "mcp":
         return
-    # Show banner (skip if version flag is set, as it will exit)
-    if not version:
+    # Show banner only on an interactive terminal (not when piped, e.g. `cliplin adr generate . | pbcopy`);
+    # skip if version flag is set (it exits) or CLIPLIN_NO_BANNER is set
+    if not version and sys.stdout.isatty() and not os.environ.get("CLIPLIN_NO_BANNER"):
         print_cliplin_banner()
-    # Validate Python version
-    if sys.version_info < (3, 10):
-        console.print(
-            "[bold red]Error:[/bold red] Python 3.10 or higher is required. "
-            f"Current version: {sys.version.split()[0]}"
-        )
-        raise typer.Exit(code=1)
-
-
-# Create feature subcommand group
-feature_app = typer.Typer(name="feature", help="Feature-related commands")
-feature_app.command(name="apply")(feature_apply_command)
-
-# Create adr subcommand group
-adr_app = typer.Typer(name="adr", help="ADR-related commands")
-adr_app.command(name="generate")(adr_generate_command)
-
-# Create knowledge subcommand group
-knowledge_app = typer.Typer(name="knowledge", help="Manage knowledge packages (ADRs, rules, features, etc.)")
-knowledge_app.command(name="list")(knowledge_list_command)
-knowledge_app.command(name="add")(knowledge_add_command)
-knowledge_app.command(name="remove")(knowledge_remove_command)
-knowledge_app.command(name="update")(knowledge_update_command)
-knowledge_app.command(name="show")(knowledge_show_command)
-knowledge_app.command(name="install")(knowledge_install_command)
-
-# Register commands
-app.command(name="init")(init_command)
-app.command(name="validate")(validate_command)
-app.command(name="reindex")(reindex_command)
-app.command(name="mcp")(mcp_command)
-app.command(name="tool")(tool_command)
-app.add_typer(feature_app)
-app.add_typer(adr_app)
-app.add_typer(knowledge_app)
 
 
 def main() -> None:
     """CLI entry point."""
+    # MCP stdio mode: bypass Typer and the callback entirely; only protocol messages may reach stdout
+    if sys.argv[1:] == ["mcp"]:
+        from cliplin.commands.mcp import mcp_command
+
+        mcp_command()
+        return
     app()
 
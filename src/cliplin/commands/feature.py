@@ -1,13 +1,34 @@
 """Feature apply command for generating implementation prompts."""
 
+import os
+import stat
 from pathlib import Path
 
 import typer
-from rich.console import Console
 
 from cliplin.utils.chromadb import get_chromadb_path
 
-console = Console()
+
+def read_file_bytes(path: str | Path) -> bytes:
+    """
+    Read a whole file with one os.read on a raw fd (no buffered/text I/O layers).
+    Raises OSError if path is not a regular file (opened non-blocking, so a FIFO cannot hang).
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0))
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            raise OSError(f"Not a regular file: {path}")
+        return os.read(fd, st.st_size)
+    finally:
+        os.close(fd)
+
+
+def _print_error(message: str) -> None:
+    """Print an error message. Rich is imported only here, so the prompt output path never loads it."""
+    from rich.console import Console
+
+    Console().print(f"[bold red]Error:[/bold red] {message}")
 
 
 def feature_apply_command(
@@ -18,98 +39,102 @@ def feature_apply_command(
 ) -> None:
     """Generate an implementation prompt for a feature file."""
     project_root = Path.cwd()
+    root_str = str(project_root)
     
-    # Validate feature file path
-    feature_path = project_root / feature_filepath
-    
-    if not feature_path.exists():
-        console.print(
-            f"[bold red]Error:[/bold red] Feature file not found: {feature_filepath}\n"
-            "Please check that the file path is correct."
-        )
-        raise typer.Exit(code=1)
+    # Validate feature file path before touching the file (reading it doubles as the existence check).
+    # Plain string paths: cwd is already absolute, so abspath + prefix checks replace relative_to().
+    feature_path = os.path.abspath(os.path.join(root_str, feature_filepath))
     
     # Validate file is in docs/features/ directory
-    relative_path = feature_path.relative_to(project_root)
-    if not str(relative_path).startswith("docs/features/"):
-        console.print(
-            f"[bold red]Error:[/bold red] File is not in the docs/features/ directory: {feature_filepath}\n"
+    if not feature_path.startswith(os.path.join(root_str, "docs", "features", "")):
+        _print_error(
+            f"File is not in the docs/features/ directory: {feature_filepath}\n"
             "Feature files must be located in docs/features/"
         )
         raise typer.Exit(code=1)
     
     # Validate file extension
-    if not feature_path.suffix == ".feature":
-        console.print(
-            f"[bold red]Error:[/bold red] File is not a valid feature file: {feature_filepath}\n"
+    if not feature_path.endswith(".feature"):
+        _print_error(
+            f"File is not a valid feature file: {feature_filepath}\n"
             "Feature files must have a .feature extension"
         )
         raise typer.Exit(code=1)
     
+    try:
+        feature_bytes = read_file_bytes(feature_path)
+    except (FileNotFoundError, NotADirectoryError):
+        _print_error(
+            f"Feature file not found: {feature_filepath}\n"
+            "Please check that the file path is correct."
+        )
+        raise typer.Exit(code=1)
+    except OSError as e:
+        # Directories, FIFOs and unreadable files
+        _print_error(f"File is not a valid feature file: {feature_filepath}\n{e}")
+        raise typer.Exit(code=1)
+    
     # Check if ChromaDB is initialized
     db_path = get_chromadb_path(project_root)
     if not db_path.exists():
-        console.print(
-            "[bold red]Error:[/bold red] ChromaDB is not initialized.\n"
+        _print_error(
+            "ChromaDB is not initialized.\n"
             "Run 'cliplin init' to initialize the project first."
         )
         raise typer.Exit(code=1)
     
     try:
-        # Read feature file content
-        feature_content = feature_path.read_text(encoding="utf-8")
+        # Decode feature file content (universal newlines, as read_text would)
+        feature_content = feature_bytes.decode("utf-8")
+        if "\r" in feature_content:
+            feature_content = feature_content.replace("\r\n", "\n").replace("\r", "\n")
         
         # Generate structured prompt
         prompt = generate_implementation_prompt(
-            feature_filepath=relative_path,
+            feature_filepath=Path(feature_path[len(root_str):].lstrip(os.sep)),
             feature_content=feature_content,
         )
         
-        # Output prompt to stdout
-        console.print(prompt)
+        # Output prompt to stdout as-is (plain markdown; no Rich markup parsing or wrapping)
+        typer.echo(prompt)
         
     except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
+        _print_error(str(e))
         raise typer.Exit(code=1)
 
 
+IMPLEMENTATION_PROMPT_TEMPLATE = """# Implementation Prompt
+
+## Feature: {feature_filepath}
+
+## Feature Content
+
+```gherkin
+{feature_content}
+```
+
+## Implementation Instructions
+
+Please implement this feature following the Cliplin framework:
+
+1. **Load context**: Query ChromaDB collections to retrieve relevant context (ADRs, rules, related features, UI Intent)
+2. **Analyze the feature**: Review all scenarios and understand the business requirements
+3. **Review context**: Consider the business context, technical constraints, and related features
+4. **Design architecture**: Identify domain entities, use cases, and boundaries
+5. **Implement business logic**: Follow the technical specifications and constraints
+6. **Write tests**: Create unit tests and BDD tests for all scenarios
+7. **Validate**: Ensure all tests pass and the feature is complete
+
+Follow the Cliplin framework rules for feature implementation as defined in the project context.
+"""
+
+
 def generate_implementation_prompt(
     feature_filepath: Path,
     feature_content: str,
 ) -> str:
     """Generate a structured implementation prompt."""
-    
-    prompt_parts = []
-    
-    # Header
-    prompt_parts.append("# Implementation Prompt")
-    prompt_parts.append("")
-    prompt_parts.append(f"## Feature: {feature_filepath}")
-    prompt_parts.append("")
-    
-    # Feature Content Section
-    prompt_parts.append("## Feature Content")
-    prompt_parts.append("")
-    prompt_parts.append("```gherkin")
-    prompt_parts.append(feature_content)
-    prompt_parts.append("```")
-    prompt_parts.append("")
-    
-    # Implementation Instructions Section
-    prompt_parts.append("## Implementation Instructions")
-    prompt_parts.append("")
-    prompt_parts.append("Please implement this feature following the Cliplin framework:")
-    prompt_parts.append("")
-    prompt_parts.append("1. **Load context**: Query ChromaDB collections to retrieve relevant context (ADRs, rules, related features, UI Intent)")
-    prompt_parts.append("2. **Analyze the feature**: Review all scenarios and understand the business requirements")
-    prompt_parts.append("3. **Review context**: Consider the business context, technical constraints, and related features")
-    prompt_parts.append("4. **Design architecture**: Identify domain entities, use cases, and boundaries")
-    prompt_parts.append("5. **Implement business logic**: Follow the technical specifications and constraints")
-    prompt_parts.append("6. **Write tests**: Create unit tests and BDD tests for all scenarios")
-    prompt_parts.append("7. **Validate**: Ensure all tests pass and the feature is complete")
-    prompt_parts.append("")
-    prompt_parts.append("Follow the Cliplin framework rules for feature implementation as defined in the project context.")
-    prompt_parts.append("")
-    
-    return "\n".join(prompt_parts)
-
+    return IMPLEMENTATION_PROMPT_TEMPLATE.format(
+        feature_filepath=feature_filepath,
+        feature_content=feature_content,
+    )
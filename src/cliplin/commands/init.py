@@ -1,8 +1,9 @@
 """Init command for initializing Cliplin projects."""
 
-import sys
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import typer
 from rich.console import Console
@@ -12,27 +13,31 @@ from cliplin.utils.chromadb import get_chromadb_client, initialize_collections
 from cliplin.utils.ai_host_integrations import (
     create_ai_tool_config,
     get_known_ai_tool_ids,
+    get_known_ai_tool_ids_set,
 )
 from cliplin.utils.templates import (
     create_cliplin_config,
-    create_framework_adr,
-    create_knowledge_packages_adr,
+    create_framework_adrs,
     create_readme_file,
-    create_rules_format_adr,
-    create_ui_intent_format_adr,
 )
 from cliplin.utils.tools import is_tool_enabled
 
 console = Console()
 
 # Required directory structure
-REQUIRED_DIRS = [
+REQUIRED_DIRS = (
     "docs/adrs",
     "docs/business",
     "docs/features",
     "docs/rules",
     ".cliplin/data/context",
-]
+)
+
+
+@lru_cache(maxsize=None)
+def get_required_dir_paths(project_root: str) -> Tuple[str, ...]:
+    """REQUIRED_DIRS as OS-native absolute paths under project_root (joined once per root)."""
+    return tuple(os.path.join(project_root, *dir_path.split("/")) for dir_path in REQUIRED_DIRS)
 
 
 def init_command(
@@ -56,17 +61,8 @@ def init_command(
     
     console.print(Panel.fit("[bold cyan]Initializing Cliplin Project[/bold cyan]"))
     
-    # Validate Python version
-    if sys.version_info < (3, 10):
-        console.print(
-            "[bold red]Error:[/bold red] Python 3.10 or higher is required. "
-            f"Current version: {sys.version.split()[0]}"
-        )
-        raise typer.Exit(code=1)
-    
     try:
         # Create directory structure
-        console.print("\n[bold]Creating directory structure...[/bold]")
         create_directory_structure(project_root)
         ensure_cliplin_in_gitignore(project_root)
 
@@ -77,15 +73,11 @@ def init_command(
         
         # Create framework context ADRs
         console.print("\n[bold]Creating framework context documentation...[/bold]")
-        create_framework_adr(project_root)
-        create_rules_format_adr(project_root)
-        if is_tool_enabled("ui-intent"):
-            create_ui_intent_format_adr(project_root)
-        create_knowledge_packages_adr(project_root)
+        create_framework_adrs(project_root, include_ui_intent=is_tool_enabled("ui-intent"))
         
         # Create AI tool configuration if specified
         if ai:
-            if ai not in get_known_ai_tool_ids():
+            if ai not in get_known_ai_tool_ids_set():
                 console.print(
                     f"[bold red]Error:[/bold red] Unknown AI tool: {ai}\n"
                     f"Available tools: {', '.join(get_known_ai_tool_ids())}"
@@ -101,7 +93,6 @@ def init_command(
         initialize_collections(client)
         
         # Validate project structure
-        console.print("\n[bold]Validating project structure...[/bold]")
         validate_project_structure(project_root)
         
         # Success message
@@ -127,9 +118,8 @@ def init_command(
 
 
 def is_cliplin_initialized(project_root: Path) -> bool:
-    """Check if Cliplin is already initialized in the project."""
-    cliplin_dir = project_root / ".cliplin"
-    return cliplin_dir.exists() and (cliplin_dir / "data" / "context").exists()
+    """Check if Cliplin is already initialized in the project (the deepest dir implies its parents)."""
+    return os.path.isdir(os.path.join(project_root, ".cliplin", "data", "context"))
 
 
 def ensure_cliplin_in_gitignore(project_root: Path) -> None:
@@ -150,22 +140,36 @@ def ensure_cliplin_in_gitignore(project_root: Path) -> None:
 
 def create_directory_structure(project_root: Path) -> None:
     """Create the required Cliplin directory structure."""
-    for dir_path in REQUIRED_DIRS:
-        full_path = project_root / dir_path
-        full_path.mkdir(parents=True, exist_ok=True)
-        console.print(f"  [green]✓[/green] Created {dir_path}/")
+    for abs_dir in get_required_dir_paths(str(project_root)):
+        os.makedirs(abs_dir, exist_ok=True)
+    lines = ["\n[bold]Creating directory structure...[/bold]"]
+    lines.extend(f"  [green]✓[/green] Created {dir_path}/" for dir_path in REQUIRED_DIRS)
+    console.print("\n".join(lines))
 
 
 def validate_project_structure(project_root: Path) -> None:
-    """Validate that all required directories exist."""
-    missing = []
-    for dir_path in REQUIRED_DIRS:
-        if not (project_root / dir_path).exists():
-            missing.append(dir_path)
+    """Validate that all required directories exist (one directory listing per parent directory)."""
+    abs_dirs = get_required_dir_paths(str(project_root))
+    present = set()
+    for parent in {os.path.dirname(abs_dir) for abs_dir in abs_dirs}:
+        try:
+            with os.scandir(parent) as entries:
+                present.update(entry.path for entry in entries if entry.is_dir())
+        except OSError:
+            continue
+    missing = [
+        dir_path for dir_path, abs_dir in zip(REQUIRED_DIRS, abs_dirs) if abs_dir not in present
+    ]
     
     if missing:
-        console.print(f"  [red]✗[/red] Missing directories: {', '.join(missing)}")
+        console.print(
+            "\n[bold]Validating project structure...[/bold]\n"
+            f"  [red]✗[/red] Missing directories: {', '.join(missing)}"
+        )
         raise ValueError("Project structure validation failed")
     
-    console.print("  [green]✓[/green] All required directories exist")
+    console.print(
+        "\n[bold]Validating project structure...[/bold]\n"
+        "  [green]✓[/green] All required directories exist"
+    )
 
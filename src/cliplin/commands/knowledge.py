@@ -1,6 +1,9 @@
 """Knowledge package manager command: list, add, remove, update, show, install."""
 
+import os
 import subprocess
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
@@ -14,60 +17,114 @@ from cliplin.utils.chromadb import (
     get_document_ids_by_file_path_prefix,
 )
 from cliplin.utils.fingerprint import get_fingerprint_store, remove_fingerprints_by_prefix
-from cliplin.utils.ai_host_integrations.base import get_integration
+from cliplin.utils.ai_host_integrations.base import AiHostIntegration, get_integration
 from cliplin.utils.knowledge import (
     add_knowledge_package_to_config,
     clone_package,
+    fetch_source,
     get_config_path,
     get_knowledge_packages,
     get_package_path,
+    get_source_cache_path,
     load_config,
+    load_reindex_state,
     remove_knowledge_package_from_config,
     remove_package_directory,
+    remove_source_cache,
     save_config,
+    save_reindex_state,
     update_package_checkout,
 )
 
 from cliplin.commands.reindex import (
-    get_files_to_reindex,
-    reindex_file,
+    iter_files_to_reindex,
+    reindex_files_batch,
 )
 
 console = Console()
 
 
-def _reindex_and_link_skills(
+def _reindex_package(
+    store: ContextStore,
+    fingerprint_store: FingerprintStore,
     project_root: Path,
-    name: str,
-    source: str,
-    config: dict,
+    pkg_path: Path,
+) -> dict[str, int] | None:
+    """
+    Reindex the context files of one package directory. Returns the reindex stats, or None
+    (nothing indexed) if the context store is not initialized.
+    """
+    if not store.is_initialized():
+        return None
+    store.ensure_collections()
+    files = iter_files_to_reindex(
+        project_root,
+        file_path=None,
+        file_type=None,
+        directory=pkg_path.relative_to(project_root).as_posix(),
+    )
+    return reindex_files_batch(store, fingerprint_store, files, project_root)
+
+
+def _reindexed_revision(stats: dict[str, int] | None, revision: str) -> str | None:
+    """
+    Revision to record after reindexing a package: None (forget it) unless every file was indexed,
+    so install reindexes the package again instead of skipping it as unchanged.
+    """
+    if stats is None or stats["errors"]:
+        if stats:
+            console.print(
+                f"[yellow]Warning:[/yellow] {stats['errors']} file(s) could not be indexed; "
+                "run 'cliplin knowledge install' to retry."
+            )
+        return None
+    return revision
+
+
+def _record_reindexed_revision(
+    project_root: Path, store: ContextStore, pkg_path: Path, revision: str | None
 ) -> None:
-    """Reindex a package and link skills if host integration supports it."""
-    store: ContextStore = get_context_store(project_root)
-    fingerprint_store: FingerprintStore = get_fingerprint_store(project_root)
-    pkg_path = get_package_path(project_root, name, source)
-    if store.is_initialized():
-        store.ensure_collections()
-        pkg_dir_arg = pkg_path.relative_to(project_root).as_posix()
-        files = get_files_to_reindex(
-            project_root,
-            file_path=None,
-            file_type=None,
-            directory=pkg_dir_arg,
-        )
-        for f in files:
-            try:
-                reindex_file(store, fingerprint_store, f, project_root, verbose=False)
-            except Exception:
-                pass
+    """
+    Remember the revision a package was last reindexed at (None forgets it), so install can skip
+    unchanged packages. Nothing is recorded while the context store is not initialized.
+    """
+    state = load_reindex_state(project_root)
+    if revision is None:
+        if state.pop(pkg_path.name, None) is None:
+            return
+    elif store.is_initialized():
+        state[pkg_path.name] = revision
+    else:
+        return
+    save_reindex_state(project_root, state)
+
+
+def _get_skills_integration(config: dict) -> AiHostIntegration | None:
+    """Host integration for the configured ai_tool, or None if not set or unknown."""
     ai_tool = config.get("ai_tool")
-    if ai_tool:
-        integration = get_integration(ai_tool)
-        if integration is not None and hasattr(integration, "link_knowledge_skills"):
-            try:
-                integration.link_knowledge_skills(project_root, pkg_path)
-            except Exception:
-                pass
+    return get_integration(ai_tool) if ai_tool else None
+
+
+def _link_package_skills(
+    project_root: Path, pkg_path: Path, integration: AiHostIntegration | None
+) -> None:
+    """Link package skills if the host integration supports it (e.g. Claude Desktop → .claude/skills)."""
+    if integration is not None and hasattr(integration, "link_knowledge_skills"):
+        try:
+            integration.link_knowledge_skills(project_root, pkg_path)
+        except Exception:
+            pass
+
+
+def _unlink_package_skills(
+    project_root: Path, pkg_path: Path, integration: AiHostIntegration | None
+) -> None:
+    """Unlink package skills if the host integration supports it (call before deleting the package dir)."""
+    if integration is not None and hasattr(integration, "unlink_knowledge_skills"):
+        try:
+            integration.unlink_knowledge_skills(project_root, pkg_path)
+        except Exception:
+            pass
 
 
 def _require_config(project_root: Path) -> dict:
@@ -81,9 +138,8 @@ def _require_config(project_root: Path) -> dict:
     return load_config(project_root)
 
 
-def _find_package_entry(project_root: Path, name: str) -> dict | None:
-    """Get knowledge entry by name from config; None if not found."""
-    config = load_config(project_root)
+def _find_package_entry(config: dict, name: str) -> dict | None:
+    """Get knowledge entry by name from an already-loaded config; None if not found."""
     for pkg in get_knowledge_packages(config):
         if pkg["name"] == name:
             return pkg
@@ -124,46 +180,24 @@ def knowledge_add_command(
     config = _require_config(project_root)
 
     try:
-        clone_package(project_root, name, source, version)
+        fetched = fetch_source(project_root, source, version)
+        clone_package(project_root, name, source, version, fetched)
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]Error:[/bold red] Git failed: {e.stderr or e}")
         raise typer.Exit(code=1)
-    except ValueError as e:
+    except (OSError, tarfile.TarError, ValueError) as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(code=1)
 
     config = add_knowledge_package_to_config(config, name, source, version)
     save_config(project_root, config)
 
-    # Reindex this package only (directory scope)
+    # Reindex this package only (directory scope), then link its skills
+    pkg_path = get_package_path(project_root, name, source)
     store: ContextStore = get_context_store(project_root)
-    fingerprint_store: FingerprintStore = get_fingerprint_store(project_root)
-    if store.is_initialized():
-        store.ensure_collections()
-        pkg_path = get_package_path(project_root, name, source)
-        # Collect files under this package that match context types
-        pkg_dir_arg = pkg_path.relative_to(project_root).as_posix()
-        files = get_files_to_reindex(
-            project_root,
-            file_path=None,
-            file_type=None,
-            directory=pkg_dir_arg,
-        )
-        for f in files:
-            try:
-                reindex_file(store, fingerprint_store, f, project_root, verbose=False)
-            except Exception:
-                pass
-
-    # Optional: host integration may link package skills (e.g. Claude Desktop → .claude/skills)
-    ai_tool = config.get("ai_tool")
-    if ai_tool:
-        integration = get_integration(ai_tool)
-        if integration is not None and hasattr(integration, "link_knowledge_skills"):
-            try:
-                integration.link_knowledge_skills(project_root, pkg_path)
-            except Exception:
-                pass
+    stats = _reindex_package(store, get_fingerprint_store(project_root), project_root, pkg_path)
+    _record_reindexed_revision(project_root, store, pkg_path, _reindexed_revision(stats, fetched[1]))
+    _link_package_skills(project_root, pkg_path, _get_skills_integration(config))
 
     console.print(Panel.fit(f"[bold green]✓[/bold green] Added knowledge package [cyan]{name}[/cyan] and reindexed."))
 
@@ -174,7 +208,7 @@ def knowledge_remove_command(
     """Remove a knowledge package and purge its documents from the context store."""
     project_root = Path.cwd()
     config = _require_config(project_root)
-    entry = _find_package_entry(project_root, name)
+    entry = _find_package_entry(config, name)
     if not entry:
         console.print(f"[bold red]Error:[/bold red] No knowledge package named [cyan]{name}[/cyan] in cliplin.yaml.")
         raise typer.Exit(code=1)
@@ -185,6 +219,7 @@ def knowledge_remove_command(
 
     store = get_context_store(project_root)
     if store.is_initialized():
+        store.ensure_collections()
         ids_by_collection = get_document_ids_by_file_path_prefix(store, prefix)
         for coll, ids in ids_by_collection.items():
             if ids:
@@ -192,17 +227,13 @@ def knowledge_remove_command(
 
     remove_fingerprints_by_prefix(project_root, prefix)
     # Optional: host integration may unlink package skills (before deleting package dir)
-    ai_tool = config.get("ai_tool")
-    if ai_tool:
-        integration = get_integration(ai_tool)
-        if integration is not None and hasattr(integration, "unlink_knowledge_skills"):
-            try:
-                integration.unlink_knowledge_skills(project_root, pkg_path)
-            except Exception:
-                pass
+    _unlink_package_skills(project_root, pkg_path, _get_skills_integration(config))
     config = remove_knowledge_package_from_config(config, name)
     save_config(project_root, config)
     remove_package_directory(project_root, name, source)
+    _record_reindexed_revision(project_root, store, pkg_path, None)
+    if all(pkg["source"] != source for pkg in get_knowledge_packages(config)):
+        remove_source_cache(project_root, source)
 
     console.print(Panel.fit(f"[bold green]✓[/bold green] Removed knowledge package [cyan]{name}[/cyan]."))
 
@@ -214,7 +245,7 @@ def knowledge_update_command(
     """Update a knowledge package to the given (or configured) version and reindex."""
     project_root = Path.cwd()
     config = _require_config(project_root)
-    entry = _find_package_entry(project_root, name)
+    entry = _find_package_entry(config, name)
     if not entry:
         console.print(f"[bold red]Error:[/bold red] No knowledge package named [cyan]{name}[/cyan] in cliplin.yaml.")
         raise typer.Exit(code=1)
@@ -223,11 +254,12 @@ def knowledge_update_command(
     ref = version or entry["version"]
 
     try:
-        update_package_checkout(project_root, name, source, ref)
+        fetched = fetch_source(project_root, source, ref)
+        update_package_checkout(project_root, name, source, ref, fetched)
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]Error:[/bold red] Git failed: {e.stderr or e}")
         raise typer.Exit(code=1)
-    except FileNotFoundError as e:
+    except (OSError, tarfile.TarError, ValueError) as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(code=1)
 
@@ -235,34 +267,37 @@ def knowledge_update_command(
         config = add_knowledge_package_to_config(config, name, source, version)
         save_config(project_root, config)
 
-    store = get_context_store(project_root)
-    fingerprint_store = get_fingerprint_store(project_root)
-    if store.is_initialized():
-        store.ensure_collections()
-        pkg_path = get_package_path(project_root, name, source)
-        pkg_dir_arg = pkg_path.relative_to(project_root).as_posix()
-        files = get_files_to_reindex(
-            project_root,
-            file_path=None,
-            file_type=None,
-            directory=pkg_dir_arg,
-        )
-        for f in files:
-            try:
-                reindex_file(store, fingerprint_store, f, project_root, verbose=False)
-            except Exception:
-                pass
+    pkg_path = get_package_path(project_root, name, source)
+    store: ContextStore = get_context_store(project_root)
+    stats = _reindex_package(store, get_fingerprint_store(project_root), project_root, pkg_path)
+    _record_reindexed_revision(project_root, store, pkg_path, _reindexed_revision(stats, fetched[1]))
 
     console.print(Panel.fit(f"[bold green]✓[/bold green] Updated knowledge package [cyan]{name}[/cyan] and reindexed."))
 
 
+def _count_files_excluding_git(root: Path) -> int:
+    """Count files under root, skipping anything named .git; symlinked directories are not descended."""
+    count = 0
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name == ".git":
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    count += 1
+    return count
+
+
 def knowledge_show_command(
     name: str = typer.Argument(..., help="Package name"),
 ) -> None:
     """Show details for a knowledge package."""
     project_root = Path.cwd()
     config = load_config(project_root)
-    entry = _find_package_entry(project_root, name)
+    entry = _find_package_entry(config, name)
     if not entry:
         console.print(f"[bold red]Error:[/bold red] No knowledge package named [cyan]{name}[/cyan] in cliplin.yaml.")
         raise typer.Exit(code=1)
@@ -275,13 +310,51 @@ def knowledge_show_command(
     console.print(f"[bold]Installed:[/bold] [green]yes[/green]" if pkg_path.exists() else "[bold]Installed:[/bold] [dim]no[/dim]")
     if pkg_path.exists():
         # Count files in the package on disk (exclude .git); show package content, not indexed count
-        file_count = sum(
-            1 for _ in pkg_path.rglob("*")
-            if _.is_file() and ".git" not in _.parts
-        )
+        file_count = _count_files_excluding_git(pkg_path)
         console.print(f"[bold]Files:[/bold]   {file_count}")
 
 
+def _install_source_packages(
+    project_root: Path, packages: list[dict], force: bool, reindex_state: dict[str, str]
+) -> dict[str, dict]:
+    """
+    Clone or update the packages of one source, fetching each distinct version once.
+    Returns package directory name -> {"error": message to print or None, "revision": fetched revision,
+    "unchanged": True if the installed package is already at that revision and reindexed}.
+    """
+    results: dict[str, dict] = {}
+    fetched: dict[str, tuple[Path, str]] = {}
+    for pkg in packages:
+        name = pkg["name"]
+        source = pkg["source"]
+        version = pkg["version"]
+        pkg_path = get_package_path(project_root, name, source)
+        installed = not force and pkg_path.exists()
+        # A missing or emptied package directory is re-extracted even if its revision is recorded
+        intact = installed and any(pkg_path.iterdir())
+        action = "updating" if installed else ("reinstalling" if force else "installing")
+        if force:
+            remove_package_directory(project_root, name, source)
+        result = {"error": None, "revision": None, "unchanged": False}
+        results[pkg_path.name] = result
+        try:
+            if version not in fetched:
+                fetched[version] = fetch_source(project_root, source, version)
+            result["revision"] = fetched[version][1]
+            if intact and reindex_state.get(pkg_path.name) == result["revision"]:
+                result["unchanged"] = True
+            elif installed:
+                update_package_checkout(project_root, name, source, version, fetched[version])
+            else:
+                clone_package(project_root, name, source, version, fetched[version])
+        except subprocess.CalledProcessError as e:
+            result["error"] = f"[bold red]Error[/bold red] {action} [cyan]{name}[/cyan]: {e.stderr or e}"
+        except (ValueError, OSError, tarfile.TarError) as e:
+            # OSError includes a missing package directory and failures renaming the staged content
+            result["error"] = f"[bold red]Error[/bold red] {action} [cyan]{name}[/cyan]: {e}"
+    return results
+
+
 def knowledge_install_command(
     force: bool = typer.Option(False, "--force", "-f", help="Reinstall all packages (remove + clone fresh) using configured version"),
 ) -> None:
@@ -294,65 +367,62 @@ def knowledge_install_command(
         console.print("[dim]No knowledge packages declared in cliplin.yaml. Add one with: cliplin knowledge add <name> <source> <version>[/dim]")
         return
 
-    store = get_context_store(project_root)
+    store: ContextStore = get_context_store(project_root)
+    fingerprint_store: FingerprintStore = get_fingerprint_store(project_root)
+    integration = _get_skills_integration(config)
     if store.is_initialized():
         store.ensure_collections()
 
-    count = 0
+    if force:
+        # Purge indexed documents, fingerprints and skills before recloning (store writes stay sequential)
+        for pkg in packages:
+            pkg_path = get_package_path(project_root, pkg["name"], pkg["source"])
+            if not pkg_path.exists():
+                continue
+            prefix = pkg_path.relative_to(project_root).as_posix() + "/"
+            if store.is_initialized():
+                ids_by_collection = get_document_ids_by_file_path_prefix(store, prefix)
+                for coll, ids in ids_by_collection.items():
+                    if ids:
+                        store.delete_documents(coll, ids)
+            remove_fingerprints_by_prefix(project_root, prefix)
+            _unlink_package_skills(project_root, pkg_path, integration)
+
+    # Git work is independent per source: fetch concurrently across sources, sequentially within
+    # one source (packages of the same source share one cached repository and fetched versions).
+    # Group by cache path so spellings of one source (github:o/r, o/r) never fetch concurrently.
+    by_source: dict[Path, list[dict]] = {}
     for pkg in packages:
-        name = pkg["name"]
-        source = pkg["source"]
-        version = pkg["version"]
-        pkg_path = get_package_path(project_root, name, source)
+        by_source.setdefault(get_source_cache_path(project_root, pkg["source"]), []).append(pkg)
+    reindex_state = load_reindex_state(project_root)
+    results: dict[str, dict] = {}
+    with ThreadPoolExecutor(max_workers=min(len(by_source), 8)) as executor:
+        for source_results in executor.map(
+            lambda source_packages: _install_source_packages(
+                project_root, source_packages, force, reindex_state
+            ),
+            by_source.values(),
+        ):
+            results.update(source_results)
 
-        if force:
-            if pkg_path.exists():
-                prefix = pkg_path.relative_to(project_root).as_posix() + "/"
-                if store.is_initialized():
-                    ids_by_collection = get_document_ids_by_file_path_prefix(store, prefix)
-                    for coll, ids in ids_by_collection.items():
-                        if ids:
-                            store.delete_documents(coll, ids)
-                remove_fingerprints_by_prefix(project_root, prefix)
-                ai_tool = config.get("ai_tool")
-                if ai_tool:
-                    integration = get_integration(ai_tool)
-                    if integration is not None and hasattr(integration, "unlink_knowledge_skills"):
-                        try:
-                            integration.unlink_knowledge_skills(project_root, pkg_path)
-                        except Exception:
-                            pass
-            remove_package_directory(project_root, name, source)
-            try:
-                clone_package(project_root, name, source, version)
-            except subprocess.CalledProcessError as e:
-                console.print(f"[bold red]Error[/bold red] reinstalling [cyan]{name}[/cyan]: {e.stderr or e}")
-                continue
-            except ValueError as e:
-                console.print(f"[bold red]Error[/bold red] reinstalling [cyan]{name}[/cyan]: {e}")
-                continue
-        else:
-            if pkg_path.exists():
-                try:
-                    update_package_checkout(project_root, name, source, version)
-                except subprocess.CalledProcessError as e:
-                    console.print(f"[bold red]Error[/bold red] updating [cyan]{name}[/cyan]: {e.stderr or e}")
-                    continue
-                except FileNotFoundError as e:
-                    console.print(f"[bold red]Error[/bold red] updating [cyan]{name}[/cyan]: {e}")
-                    continue
+    count = 0
+    for pkg in packages:
+        pkg_path = get_package_path(project_root, pkg["name"], pkg["source"])
+        result = results[pkg_path.name]
+        if result["error"]:
+            console.print(result["error"])
+            continue
+        # Same revision as the last reindex: content on disk and in the store is already current
+        if not result["unchanged"]:
+            stats = _reindex_package(store, fingerprint_store, project_root, pkg_path)
+            revision = _reindexed_revision(stats, result["revision"])
+            if revision is not None:
+                reindex_state[pkg_path.name] = revision
             else:
-                try:
-                    clone_package(project_root, name, source, version)
-                except subprocess.CalledProcessError as e:
-                    console.print(f"[bold red]Error[/bold red] installing [cyan]{name}[/cyan]: {e.stderr or e}")
-                    continue
-                except ValueError as e:
-                    console.print(f"[bold red]Error[/bold red] installing [cyan]{name}[/cyan]: {e}")
-                    continue
-
-        _reindex_and_link_skills(project_root, name, source, config)
+                reindex_state.pop(pkg_path.name, None)
+        _link_package_skills(project_root, pkg_path, integration)
         count += 1
+    save_reindex_state(project_root, reindex_state)
 
     if force:
         console.print(Panel.fit(f"[bold green]✓[/bold green] Reinstalled [cyan]{count}[/cyan] package(s)."))
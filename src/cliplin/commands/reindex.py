@@ -1,7 +1,10 @@
 """Reindex command for updating context store. Depends on ContextStore and FingerprintStore protocols."""
 
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import typer
 from rich.console import Console
@@ -9,18 +12,40 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from cliplin.protocols import ContextStore, FingerprintStore
+from cliplin.protocols import ContextStore, FingerprintStore, FingerprintWriter
 from cliplin.utils.chromadb import (
     COLLECTION_MAPPINGS,
     KNOWLEDGE_PATH_MAPPINGS,
+    FileNameMatcher,
+    classify_context_file,
+    file_pattern_matcher,
     get_collection_for_file,
     get_context_store,
-    get_file_type,
+    walk_context_files,
 )
 from cliplin.utils.fingerprint import get_fingerprint_store
 
 console = Console()
 
+# Files per add/update call to the context store during reindexing
+REINDEX_BATCH_SIZE = 128
+# Worker threads preparing batches (file reads and fingerprint hashing)
+DEFAULT_REINDEX_JOBS = min(8, os.cpu_count() or 1)
+# Files listed by the dry-run report unless --limit says otherwise
+DRY_RUN_ROW_LIMIT = 200
+
+# Knowledge package segment (e.g. "docs/rules") -> file name matcher, and the directories leading
+# to nested segments (e.g. "docs"), so one walk of a package classifies every directory it meets
+_KNOWLEDGE_SEGMENT_MATCHERS: Dict[str, FileNameMatcher] = {
+    path_seg: file_pattern_matcher(file_pattern)
+    for path_seg, file_pattern, _, _ in KNOWLEDGE_PATH_MAPPINGS
+}
+_KNOWLEDGE_SEGMENT_PARENTS = frozenset(
+    path_seg.rsplit("/", i)[0]
+    for path_seg in _KNOWLEDGE_SEGMENT_MATCHERS
+    for i in range(1, path_seg.count("/") + 1)
+)
+
 
 def reindex_command(
     file_path: Optional[str] = typer.Argument(
@@ -52,6 +77,19 @@ def reindex_command(
         "--interactive",
         help="Prompt for confirmation before reindexing",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_REINDEX_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of worker threads reading and fingerprinting files",
+    ),
+    limit: int = typer.Option(
+        DRY_RUN_ROW_LIMIT,
+        "--limit",
+        min=0,
+        help="Maximum files listed by --dry-run (0 lists all)",
+    ),
 ) -> None:
     """Reindex context files into the context store (protocol-based)."""
     project_root = Path.cwd()
@@ -82,7 +120,9 @@ def reindex_command(
 
         if dry_run:
             console.print(Panel.fit("[bold cyan]Dry Run Mode[/bold cyan]"))
-            display_dry_run_report(store, fingerprint_store, files_to_process, project_root)
+            display_dry_run_report(
+                store, fingerprint_store, files_to_process, project_root, limit or None
+            )
             raise typer.Exit()
 
         if interactive:
@@ -98,26 +138,21 @@ def reindex_command(
 
         console.print(Panel.fit("[bold cyan]Reindexing Context Files[/bold cyan]"))
 
-        stats = {"added": 0, "updated": 0, "skipped": 0, "errors": 0}
-
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
             task = progress.add_task("Reindexing...", total=len(files_to_process))
-            for file_path_obj in files_to_process:
-                try:
-                    result = reindex_file(
-                        store, fingerprint_store, file_path_obj, project_root, verbose
-                    )
-                    stats[result] += 1
-                    progress.update(task, advance=1)
-                except Exception as e:
-                    stats["errors"] += 1
-                    if verbose:
-                        console.print(f"  [red]✗[/red] Error processing {file_path_obj}: {e}")
-                    progress.update(task, advance=1)
+            stats = reindex_files_batch(
+                store,
+                fingerprint_store,
+                files_to_process,
+                project_root,
+                verbose,
+                on_progress=lambda n: progress.update(task, advance=n),
+                jobs=jobs,
+            )
 
         display_summary(stats)
 
@@ -134,9 +169,20 @@ def get_files_to_reindex(
     file_type: Optional[str],
     directory: Optional[str],
 ) -> List[Path]:
-    """Get list of files to reindex based on arguments."""
-    files = []
-    
+    """Get sorted, de-duplicated list of files to reindex based on arguments (for display and reindex_command)."""
+    return sorted(set(iter_files_to_reindex(project_root, file_path, file_type, directory)))
+
+
+def iter_files_to_reindex(
+    project_root: Path,
+    file_path: Optional[str],
+    file_type: Optional[str],
+    directory: Optional[str],
+) -> Iterator[Path]:
+    """
+    Yield files to reindex based on arguments, in walk order. Scanned directories are disjoint,
+    so no file is yielded twice; use when only iterating (e.g. batch reindex of a package).
+    """
     if file_path:
         # Single file
         full_path = project_root / file_path
@@ -151,7 +197,7 @@ def get_files_to_reindex(
                 "Valid directories: docs/adrs, docs/business, docs/features, docs/rules, docs/ui-intent"
             )
         
-        files.append(full_path)
+        yield full_path
     
     elif file_type:
         # Files of specific type
@@ -172,13 +218,9 @@ def get_files_to_reindex(
         if file_type == "md":
             # Search both adrs and business
             for dir_name in ["docs/adrs", "docs/business"]:
-                dir_path = project_root / dir_name
-                if dir_path.exists():
-                    files.extend(dir_path.rglob("*.md"))
+                yield from walk_context_files(project_root / dir_name, "*.md")
         else:
-            dir_path = project_root / dir_pattern[0]
-            if dir_path.exists():
-                files.extend(dir_path.rglob(dir_pattern[1]))
+            yield from walk_context_files(project_root / dir_pattern[0], dir_pattern[1])
     
     elif directory:
         # Files in specific directory (project docs or .cliplin/knowledge/<pkg>)
@@ -190,22 +232,14 @@ def get_files_to_reindex(
         if dir_norm == ".cliplin/knowledge" or dir_norm.startswith(".cliplin/knowledge/"):
             if dir_norm == ".cliplin/knowledge":
                 # Scan all packages under knowledge root
-                for pkg_dir in dir_path.iterdir():
-                    if pkg_dir.is_dir():
-                        for path_seg, file_pattern, _, _ in KNOWLEDGE_PATH_MAPPINGS:
-                            seg_path = pkg_dir / path_seg
-                            if seg_path.exists():
-                                files.extend(seg_path.rglob(file_pattern))
+                yield from _walk_knowledge_packages(dir_path)
             else:
                 # Single package dir: .cliplin/knowledge/<pkg>
-                for path_seg, file_pattern, _, _ in KNOWLEDGE_PATH_MAPPINGS:
-                    seg_path = dir_path / path_seg
-                    if seg_path.exists():
-                        files.extend(seg_path.rglob(file_pattern))
+                yield from _walk_knowledge_package(dir_path)
         else:
             for collection_name, mapping in COLLECTION_MAPPINGS.items():
                 if directory in mapping["directories"]:
-                    files.extend(dir_path.rglob(mapping["file_pattern"]))
+                    yield from walk_context_files(dir_path, mapping["file_pattern"])
                     break
             else:
                 raise ValueError(f"Directory is not a valid context directory: {directory}")
@@ -214,73 +248,269 @@ def get_files_to_reindex(
         # All context files: project docs + knowledge packages
         for collection_name, mapping in COLLECTION_MAPPINGS.items():
             for dir_name in mapping["directories"]:
-                dir_path = project_root / dir_name
-                if dir_path.exists():
-                    files.extend(dir_path.rglob(mapping["file_pattern"]))
+                yield from walk_context_files(project_root / dir_name, mapping["file_pattern"])
         # .cliplin/knowledge/<pkg>/... (structure-agnostic per KNOWLEDGE_PATH_MAPPINGS)
-        knowledge_root = project_root / ".cliplin" / "knowledge"
-        if knowledge_root.exists():
-            for pkg_dir in knowledge_root.iterdir():
-                if pkg_dir.is_dir():
-                    for path_seg, file_pattern, _, _ in KNOWLEDGE_PATH_MAPPINGS:
-                        seg_path = pkg_dir / path_seg
-                        if seg_path.exists():
-                            files.extend(seg_path.rglob(file_pattern))
-    return sorted(set(files))
-
-
-def reindex_file(
+        yield from _walk_knowledge_packages(project_root / ".cliplin" / "knowledge")
+
+
+def _walk_knowledge_package(pkg_dir: Path) -> Iterator[Path]:
+    """
+    Yield context files of one knowledge package (KNOWLEDGE_PATH_MAPPINGS segments only) in a
+    single traversal: directories that are neither a segment nor lead to one are not descended.
+    """
+    # (directory, path relative to pkg_dir, file name matcher of the enclosing segment or None)
+    stack: List[Tuple[str, str, Optional[FileNameMatcher]]] = [(str(pkg_dir), "", None)]
+    while stack:
+        dir_path, rel_dir, matches = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == ".git":
+                        continue
+                    if matches is not None:
+                        stack.append((entry.path, "", matches))
+                        continue
+                    rel = rel_dir + entry.name
+                    segment_matches = _KNOWLEDGE_SEGMENT_MATCHERS.get(rel)
+                    if segment_matches is not None:
+                        stack.append((entry.path, "", segment_matches))
+                    elif rel in _KNOWLEDGE_SEGMENT_PARENTS:
+                        stack.append((entry.path, rel + "/", None))
+                elif matches is not None and matches(entry.name) and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _walk_knowledge_packages(knowledge_root: Path) -> Iterator[Path]:
+    """Yield context files of every package directory under the knowledge root."""
+    try:
+        entries = os.scandir(knowledge_root)
+    except OSError:
+        return
+    with entries:
+        pkg_dirs = [Path(e.path) for e in entries if e.is_dir()]
+    for pkg_dir in pkg_dirs:
+        yield from _walk_knowledge_package(pkg_dir)
+
+
+def reindex_files_batch(
     store: ContextStore,
     fingerprint_store: FingerprintStore,
-    file_path: Path,
+    files: Iterable[Path],
     project_root: Path,
-    verbose: bool,
-) -> str:
-    """Reindex a single file. Returns 'added', 'updated', or 'skipped' (unchanged)."""
-    relative_path = file_path.relative_to(project_root)
-    file_id = relative_path.as_posix()
-
-    collection_name = get_collection_for_file(file_path, project_root)
-    if not collection_name:
-        raise ValueError(f"Cannot determine collection for {relative_path}")
-
-    file_type = get_file_type(file_path, project_root)
-    if not file_type:
-        raise ValueError(f"Cannot determine file type for {relative_path}")
-
-    # Skip if file has not changed (fingerprint matches stored)
-    changed_result = fingerprint_store.has_changed(file_id, file_system_path=file_path)
-    if not changed_result["changed"] and changed_result.get("stored_fingerprint") is not None:
-        if verbose:
-            console.print(f"  [dim]○[/dim] Unchanged {relative_path}")
-        return "skipped"
-
-    content = file_path.read_text(encoding="utf-8")
-    content_bytes = content.encode("utf-8")
-    metadata = {
-        "file_path": file_id,
-        "type": file_type,
-        "collection": collection_name,
-    }
+    verbose: bool = False,
+    batch_size: int = REINDEX_BATCH_SIZE,
+    on_progress: Optional[Callable[[int], None]] = None,
+    jobs: int = DEFAULT_REINDEX_JOBS,
+) -> Dict[str, int]:
+    """
+    Reindex files in batches of batch_size: one fingerprint check, one existence lookup and
+    one upsert call per collection per batch. Per-file failures are counted, not raised.
+    With jobs > 1, batches are prepared (fingerprint compare, file read) on a thread pool, at most
+    2 * jobs batches ahead of the store writes, which stay on the calling thread; fingerprints are
+    saved in one write at the end.
+    Returns stats dict with keys added, updated, skipped, errors.
+    """
+    stats = {"added": 0, "updated": 0, "skipped": 0, "errors": 0}
+    files = list(files)
+    jobs = max(1, jobs)
+    if jobs > 1:
+        # Spread small file sets over all workers
+        batch_size = max(1, min(batch_size, -(-len(files) // jobs)))
+    batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+
+    # Fingerprints of all batches are written to the store once, when the run ends
+    with fingerprint_store.batch() as fingerprints:
+
+        def apply(batch: List[Path], prepared: "_PreparedBatch") -> None:
+            _store_batch(store, fingerprints, prepared, verbose, stats)
+            if on_progress:
+                on_progress(len(batch))
+
+        if jobs == 1 or len(batches) == 1:
+            for batch in batches:
+                apply(batch, _prepare_batch(fingerprint_store, batch, project_root))
+            return stats
+
+        def apply_future(batch: List[Path], future: "Future[_PreparedBatch]") -> None:
+            try:
+                prepared = future.result()
+            except Exception as e:
+                # Unexpected worker failure: count the batch's files as errors, keep going
+                prepared = _PreparedBatch()
+                root_prefix = _root_prefix(project_root)
+                prepared.errors = [
+                    (_relative_posix(file_path, project_root, root_prefix), str(e))
+                    for file_path in batch
+                ]
+            apply(batch, prepared)
+
+        # Bounded window of in-flight batches, applied in order: prepared content (text and bytes)
+        # never piles up while the calling thread is busy writing to the store
+        window = 2 * jobs
+        pending: Deque[Tuple[List[Path], "Future[_PreparedBatch]"]] = deque()
+        with ThreadPoolExecutor(max_workers=min(jobs, len(batches))) as executor:
+            for batch in batches:
+                pending.append(
+                    (batch, executor.submit(_prepare_batch, fingerprint_store, batch, project_root))
+                )
+                if len(pending) >= window:
+                    apply_future(*pending.popleft())
+            while pending:
+                apply_future(*pending.popleft())
+    return stats
+
+
+class _PreparedBatch:
+    """Result of the read-only phase of reindexing a batch."""
+
+    def __init__(self) -> None:
+        # Files are identified by their posix path relative to the project root (the document id)
+        self.skipped: List[str] = []
+        self.errors: List[Tuple[str, str]] = []
+        # collection_name -> [(file_id, content, content_bytes, metadata)]
+        self.by_collection: Dict[str, List[Tuple[str, str, bytes, Dict[str, str]]]] = {}
+        # file_id -> (st_mtime_ns, st_size) of the file as read, for the fingerprint quick check;
+        # unchanged_stats: the same for skipped files, so their entries skip hashing next time
+        self.file_stats: Dict[str, Tuple[int, int]] = {}
+        self.unchanged_stats: Dict[str, Tuple[int, int]] = {}
+
+
+def _prepare_batch(
+    fingerprint_store: FingerprintStore,
+    files: List[Path],
+    project_root: Path,
+) -> _PreparedBatch:
+    """Classify, fingerprint-check and read one batch of files. Performs no writes."""
+    prepared = _PreparedBatch()
+    candidates = []
+    root_prefix = _root_prefix(project_root)
+    for file_path in files:
+        file_id = _relative_posix(file_path, project_root, root_prefix)
+        classified = classify_context_file(file_id)
+        if not classified:
+            prepared.errors.append(
+                (file_id, f"Cannot determine collection or file type for {file_id}")
+            )
+            continue
+        candidates.append((file_path, file_id) + classified)
+
+    # Skip files whose fingerprint matches the stored one (single store load per batch)
+    changed = fingerprint_store.has_changed_many(
+        [(file_id, path) for path, file_id, _, _ in candidates]
+    )
+    for file_path, file_id, collection_name, file_type in candidates:
+        changed_result = changed[file_id]
+        if not changed_result["changed"] and changed_result.get("stored_fingerprint") is not None:
+            prepared.skipped.append(file_id)
+            if changed_result.get("file_stat") is not None:
+                prepared.unchanged_stats[file_id] = changed_result["file_stat"]
+            continue
+        try:
+            # Fingerprint the raw bytes (what has_changed hashes); decode once for the store.
+            # Stat before reading: a later write changes mtime, so the quick check cannot go stale
+            with open(file_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                content_bytes = f.read()
+            content = content_bytes.decode("utf-8")
+        except Exception as e:
+            prepared.errors.append((file_id, str(e)))
+            continue
+        if "\r" in content:
+            # Same newline normalization read_text applied to indexed documents
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        metadata = {
+            "file_path": file_id,
+            "type": file_type,
+            "collection": collection_name,
+        }
+        prepared.by_collection.setdefault(collection_name, []).append(
+            (file_id, content, content_bytes, metadata)
+        )
+        prepared.file_stats[file_id] = (st.st_mtime_ns, st.st_size)
+    return prepared
 
-    exists = store.document_exists(collection_name, file_id)
 
-    if exists:
-        store.update_documents(
-            collection_name, [file_id], documents=[content], metadatas=[metadata]
-        )
-        fingerprint_store.update(file_id, content_bytes)
-        if verbose:
-            console.print(f"  [yellow]↻[/yellow] Updated {relative_path}")
-        return "updated"
-    else:
-        store.add_documents(
-            collection_name, [file_id], [content], metadatas=[metadata]
+def _root_prefix(project_root: Path) -> str:
+    """String prefix that file paths under project_root start with."""
+    return os.path.join(str(project_root), "")
+
+
+def _relative_posix(file_path: Path, project_root: Path, root_prefix: str) -> str:
+    """
+    Posix path of file_path relative to project_root, sliced from the path string
+    (falls back to Path.relative_to for paths not spelled under root_prefix).
+    """
+    path_str = str(file_path)
+    if path_str.startswith(root_prefix):
+        relative = path_str[len(root_prefix):]
+        return relative.replace(os.sep, "/") if os.sep != "/" else relative
+    return file_path.relative_to(project_root).as_posix()
+
+
+def _store_batch(
+    store: ContextStore,
+    fingerprints: FingerprintWriter,
+    prepared: _PreparedBatch,
+    verbose: bool,
+    stats: Dict[str, int],
+) -> None:
+    """Write one prepared batch to the context store and fingerprint store, accumulating stats."""
+    stats["skipped"] += len(prepared.skipped)
+    stats["errors"] += len(prepared.errors)
+    # Verbose lines are buffered and rendered with one console.print per batch
+    log: List[str] = []
+    if verbose:
+        log.extend(
+            f"  [red]✗[/red] Error processing {file_id}: {error}"
+            for file_id, error in prepared.errors
         )
-        fingerprint_store.update(file_id, content_bytes)
-        if verbose:
-            console.print(f"  [green]+[/green] Added {relative_path}")
-        return "added"
+        log.extend(f"  [dim]○[/dim] Unchanged {file_id}" for file_id in prepared.skipped)
+
+    indexed: Dict[str, bytes] = {}
+    for collection_name, entries in prepared.by_collection.items():
+        ids = [e[0] for e in entries]
+        try:
+            # Only used to report added vs updated; the upsert itself does not depend on it
+            existing = set(store.get_existing_document_ids(collection_name, ids))
+            store.upsert_documents(
+                collection_name, ids, [e[1] for e in entries], metadatas=[e[3] for e in entries]
+            )
+            stored = entries
+        except Exception:
+            # Retry one by one so a single bad file does not fail the whole batch
+            existing = set()
+            stored = []
+            for entry in entries:
+                file_id, content, _, metadata = entry
+                try:
+                    existing.update(store.get_existing_document_ids(collection_name, [file_id]))
+                    store.upsert_documents(collection_name, [file_id], [content], metadatas=[metadata])
+                except Exception as e:
+                    stats["errors"] += 1
+                    if verbose:
+                        log.append(f"  [red]✗[/red] Error processing {file_id}: {e}")
+                    continue
+                stored.append(entry)
+        for file_id, _, content_bytes, _ in stored:
+            indexed[file_id] = content_bytes
+            if file_id in existing:
+                stats["updated"] += 1
+                if verbose:
+                    log.append(f"  [yellow]↻[/yellow] Updated {file_id}")
+            else:
+                stats["added"] += 1
+                if verbose:
+                    log.append(f"  [green]+[/green] Added {file_id}")
+
+    fingerprints.update_many(indexed, prepared.file_stats)
+    if prepared.unchanged_stats:
+        fingerprints.update_stats(prepared.unchanged_stats)
+    if log:
+        console.print("\n".join(log), highlight=False)
 
 
 def display_dry_run_report(
@@ -288,33 +518,61 @@ def display_dry_run_report(
     fingerprint_store: FingerprintStore,
     files: List[Path],
     project_root: Path,
+    limit: Optional[int] = DRY_RUN_ROW_LIMIT,
 ) -> None:
-    """Display a dry-run report: which files would be added, updated, or skipped (unchanged)."""
+    """
+    Display a dry-run report: which files would be added, updated, or skipped (unchanged).
+    Only the first limit files are checked and listed (None lists all); the rest are summarized
+    in a final "... N more" row.
+    """
     table = Table(title="Files to Reindex")
     table.add_column("File Path", style="cyan")
     table.add_column("Status", style="magenta")
     table.add_column("Action", style="green")
 
+    hidden = 0
+    if limit is not None and len(files) > limit:
+        hidden = len(files) - limit
+        files = files[:limit]
+
+    rows = []
+    root_prefix = _root_prefix(project_root)
     for file_path in files:
-        relative_path = file_path.relative_to(project_root)
-        file_id = relative_path.as_posix()
+        file_id = _relative_posix(file_path, project_root, root_prefix)
+        classified = classify_context_file(file_id)
+        rows.append((file_path, file_id, classified[0] if classified else None))
+
+    # One fingerprint store load for all files
+    changed = fingerprint_store.has_changed_many(
+        [(file_id, path) for path, file_id, collection in rows if collection]
+    )
+
+    def is_unchanged(file_id: str) -> bool:
+        changed_result = changed[file_id]
+        return not changed_result["changed"] and changed_result.get("stored_fingerprint") is not None
+
+    # One existence lookup per collection for the files that would be (re)indexed
+    ids_by_collection: Dict[str, List[str]] = {}
+    for _, file_id, collection_name in rows:
+        if collection_name and not is_unchanged(file_id):
+            ids_by_collection.setdefault(collection_name, []).append(file_id)
+    existing = {
+        (collection_name, doc_id)
+        for collection_name, ids in ids_by_collection.items()
+        for doc_id in store.get_existing_document_ids(collection_name, ids)
+    }
 
-        collection_name = get_collection_for_file(file_path, project_root)
+    for _, file_id, collection_name in rows:
         if not collection_name:
-            table.add_row(str(relative_path), "Invalid", "Skip")
-            continue
-
-        try:
-            changed_result = fingerprint_store.has_changed(file_id, file_system_path=file_path)
-            if not changed_result["changed"] and changed_result.get("stored_fingerprint") is not None:
-                table.add_row(str(relative_path), "Unchanged", "Skip")
-                continue
-            if store.document_exists(collection_name, file_id):
-                table.add_row(str(relative_path), "Changed", "Update")
-            else:
-                table.add_row(str(relative_path), "New", "Add")
-        except Exception:
-            table.add_row(str(relative_path), "New", "Add")
+            table.add_row(file_id, "Invalid", "Skip")
+        elif is_unchanged(file_id):
+            table.add_row(file_id, "Unchanged", "Skip")
+        elif (collection_name, file_id) in existing:
+            table.add_row(file_id, "Changed", "Update")
+        else:
+            table.add_row(file_id, "New", "Add")
+    if hidden:
+        table.add_row(f"[dim]... {hidden} more[/dim]", "", "")
 
     console.print(table)
 
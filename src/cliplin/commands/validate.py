@@ -1,14 +1,16 @@
 """Validate command for checking Cliplin project structure."""
 
+import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple
 
 import typer
-import yaml
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from cliplin.utils.chromadb import (
     REQUIRED_COLLECTIONS,
@@ -16,18 +18,31 @@ from cliplin.utils.chromadb import (
     get_chromadb_path,
     verify_collections,
 )
-from cliplin.utils.ai_host_integrations import get_integration, get_known_ai_tool_ids
+from cliplin.utils.ai_host_integrations import get_integration, get_known_ai_tool_ids_set
 
 console = Console()
 
-REQUIRED_DIRS = [
+REQUIRED_DIRS = (
     "docs/adrs",
     "docs/business",
     "docs/features",
     "docs/rules",
     "docs/ui-intent",
     ".cliplin/data/context",
-]
+)
+
+
+def _group_by_parent(dir_paths: Tuple[str, ...]) -> Dict[Tuple[str, ...], Dict[str, str]]:
+    """Group posix relative dir_paths by parent path components: parent parts -> {name: dir_path}."""
+    by_parent: Dict[Tuple[str, ...], Dict[str, str]] = {}
+    for dir_path in dir_paths:
+        *parent_parts, name = dir_path.split("/")
+        by_parent.setdefault(tuple(parent_parts), {})[name] = dir_path
+    return by_parent
+
+
+# REQUIRED_DIRS split into path components once, grouped by the directory that lists them
+_REQUIRED_DIRS_BY_PARENT = _group_by_parent(REQUIRED_DIRS)
 
 
 def validate_command() -> None:
@@ -47,9 +62,9 @@ def validate_command() -> None:
     
     # Validate directories
     console.print("\n[bold]Checking directories...[/bold]")
+    present_dirs = _find_existing_dirs(project_root, _REQUIRED_DIRS_BY_PARENT)
     for dir_path in REQUIRED_DIRS:
-        full_path = project_root / dir_path
-        if full_path.exists():
+        if dir_path in present_dirs:
             console.print(f"  [green]✓[/green] {dir_path}/")
         else:
             console.print(f"  [red]✗[/red] {dir_path}/ (missing)")
@@ -96,17 +111,18 @@ def validate_command() -> None:
     if config_file.exists():
         console.print(f"  [green]✓[/green] Config file exists")
         ai_tool: Optional[str] = _get_ai_tool_from_config(config_file)
-        if ai_tool is not None and ai_tool in get_known_ai_tool_ids():
+        known_ai_tools = get_known_ai_tool_ids_set()
+        if ai_tool is not None and ai_tool in known_ai_tools:
             integration = get_integration(ai_tool)
             mcp_path = integration.mcp_config_path if integration else None
             if mcp_path:
-                mcp_file = project_root / mcp_path
-                if mcp_file.exists():
+                # One stat: a missing parent dir (e.g. .cursor/) already fails it with ENOENT
+                if os.path.isfile(os.path.join(project_root, mcp_path)):
                     console.print(f"  [green]✓[/green] MCP config for {ai_tool!r} exists at {mcp_path}")
                 else:
                     console.print(f"  [red]✗[/red] MCP config for {ai_tool!r} not found at {mcp_path}")
                     errors.append(f"Missing MCP config file for ai_tool {ai_tool!r}: {mcp_path}")
-        elif ai_tool is not None and ai_tool not in get_known_ai_tool_ids():
+        elif ai_tool is not None:
             console.print(f"  [yellow]⚠[/yellow]  Unknown ai_tool in config: {ai_tool!r}")
             warnings.append(f"Unknown ai_tool in config: {ai_tool!r}")
     else:
@@ -116,12 +132,12 @@ def validate_command() -> None:
     # Summary
     console.print("\n" + "=" * 50)
     if errors:
-        console.print(Panel.fit(
-            f"[bold red]Validation Failed[/bold red]\n\n"
-            f"Found {len(errors)} error(s) and {len(warnings)} warning(s).\n\n"
-            "Errors:\n" + "\n".join(f"  • {e}" for e in errors),
-            border_style="red",
-        ))
+        # Built as Text: no markup parsing, and error messages are shown verbatim
+        summary = Text()
+        summary.append("Validation Failed", style="bold red")
+        summary.append(f"\n\nFound {len(errors)} error(s) and {len(warnings)} warning(s).\n\nErrors:\n")
+        summary.append("\n".join(f"  • {e}" for e in errors))
+        console.print(Panel.fit(summary, border_style="red"))
         raise typer.Exit(code=1)
     else:
         console.print(Panel.fit(
@@ -131,20 +147,85 @@ def validate_command() -> None:
         ))
 
 
+def _find_existing_dirs(
+    project_root: Path, by_parent: Dict[Tuple[str, ...], Dict[str, str]]
+) -> Set[str]:
+    """
+    Return the dir_paths (grouped as by _group_by_parent) that exist as directories under
+    project_root, listing each parent directory once with os.scandir instead of stat-ing every path.
+    """
+    root = str(project_root)
+    present: Set[str] = set()
+    for parent_parts, wanted in by_parent.items():
+        try:
+            with os.scandir(os.path.join(root, *parent_parts)) as entries:
+                present.update(wanted[e.name] for e in entries if e.name in wanted and e.is_dir())
+        except OSError:
+            continue
+    return present
+
+
 def _get_ai_tool_from_config(config_path: Path) -> Optional[str]:
     """Read ai_tool from cliplin.yaml at project root if present."""
-    if not config_path.exists():
+    try:
+        data = _load_config_cached(config_path)
+    except IOError:
         return None
+    return data.get("ai_tool") if data is not None else None
+
+
+def _load_config_cached(config_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Parse cliplin.yaml, reusing a JSON copy in .cliplin/cache/cliplin.yaml.json while the YAML
+    file's mtime and size match the ones recorded with it. Returns None if the YAML is invalid;
+    raises OSError if config_path is missing.
+    """
+    st = os.stat(config_path)
+    source = [st.st_mtime_ns, st.st_size]
+    cache_path = config_path.parent / ".cliplin" / "cache" / "cliplin.yaml.json"
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached["source"] == source:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = _parse_config_yaml(config_path)
+    if data is None or not cache_path.parent.parent.is_dir():
+        # Invalid YAML, or not an initialized project: validate never creates .cliplin/ itself
+        return data
+    # Written to a temporary file and renamed, so a concurrent reader never sees a partial copy
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        content = json.dumps({"source": source, "data": data})
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Not JSON-serializable (e.g. YAML dates) or not writable: parse the YAML every time
+        tmp_path.unlink(missing_ok=True)
+    return data
+
+
+def _parse_config_yaml(config_path: Path) -> Optional[Dict[str, Any]]:
+    """Parse cliplin.yaml with a safe loader; None if it is not valid YAML. Imports yaml on first use."""
+    import yaml
+
+    # LibYAML-backed loader when PyYAML was built with it; same safe semantics either way
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # pragma: no cover - depends on the PyYAML build
+        from yaml import SafeLoader
+
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data: Dict[str, Any] = yaml.safe_load(f) or {}
-        return data.get("ai_tool")
-    except (yaml.YAMLError, IOError):
+        # Bytes go straight to the loader, which detects the UTF-8/UTF-16 encoding itself
+        with open(config_path, "rb") as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+    except yaml.YAMLError:
         return None
 
 
 def is_cliplin_initialized(project_root: Path) -> bool:
-    """Check if Cliplin is already initialized in the project."""
-    cliplin_dir = project_root / ".cliplin"
-    return cliplin_dir.exists() and (cliplin_dir / "data" / "context").exists()
+    """Check if Cliplin is already initialized in the project (the deepest dir implies its parents)."""
+    return os.path.isdir(os.path.join(project_root, ".cliplin", "data", "context"))
 
@@ -6,35 +6,90 @@ See docs/rules/low-coupling-protocols.md.
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from mcp.server.fastmcp import FastMCP
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from cliplin.protocols import ContextStore, FingerprintStore
 from cliplin.utils.chromadb import get_context_store
 from cliplin.utils.fingerprint import get_fingerprint_store
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+# orjson (installed with chromadb) serializes large query/get payloads much faster than json
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 MCP_INSTRUCTIONS = """Cliplin context server: semantic search over project specs (ADRs, features, rules, UI intent).
 Use context_query_documents to load relevant context before planning or coding. Collections: business-and-architecture, features, rules, uisi.
 Use context_list_changed_documents or context_check_document_changed for change detection. Never proceed without loading context from this server."""
 
-mcp = FastMCP(
-    "cliplin-context",
-    instructions=MCP_INSTRUCTIONS,
-    json_response=True,
-)
+# Tool functions, registered on the FastMCP server when it is built (the mcp package is only
+# imported by get_mcp_server, so importing this module stays cheap)
+_TOOLS: List[Callable[..., str]] = []
+_mcp: Optional["FastMCP"] = None
+
+
+def _tool(fn: Callable[..., str]) -> Callable[..., str]:
+    """Mark fn as an MCP tool; it is registered by get_mcp_server()."""
+    _TOOLS.append(fn)
+    return fn
+
+
+def get_mcp_server() -> "FastMCP":
+    """Build the FastMCP server with all tools on first use and return it."""
+    global _mcp
+    if _mcp is None:
+        from mcp.server.fastmcp import FastMCP
+
+        server = FastMCP(
+            "cliplin-context",
+            instructions=MCP_INSTRUCTIONS,
+            json_response=True,
+        )
+        for fn in _TOOLS:
+            server.tool()(fn)
+        _mcp = server
+    return _mcp
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values json does not handle natively: arrays (e.g. embeddings) as lists, else str."""
+    tolist = getattr(obj, "tolist", None)
+    return tolist() if callable(tolist) else str(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to a JSON string (orjson when available, else json)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, default=_json_default)
 
 
 def _project_root() -> Path:
     return Path.cwd()
 
 
+# The server process serves the project it was started in, so the stores are built once
+_store: Optional[ContextStore] = None
+_fingerprint_store: Optional[FingerprintStore] = None
+
+
 def _get_store() -> ContextStore:
-    return get_context_store(_project_root())
+    global _store
+    if _store is None:
+        _store = get_context_store(_project_root())
+    return _store
 
 
 def _get_fingerprint_store() -> FingerprintStore:
-    return get_fingerprint_store(_project_root())
+    global _fingerprint_store
+    if _fingerprint_store is None:
+        _fingerprint_store = get_fingerprint_store(_project_root())
+    return _fingerprint_store
 
 
 def _ensure_db() -> None:
@@ -44,10 +99,28 @@ def _ensure_db() -> None:
         )
 
 
+def _update_fingerprints(fp_store: FingerprintStore, ids: List[str], documents: List[str]) -> None:
+    """Record fingerprints for indexed documents in one store write (best effort, never raises)."""
+    try:
+        contents = dict(zip(ids, [document.encode("utf-8") for document in documents]))
+    except UnicodeEncodeError:
+        # e.g. lone surrogates: drop only the documents that cannot be encoded
+        contents = {}
+        for doc_id, document in zip(ids, documents):
+            try:
+                contents[doc_id] = document.encode("utf-8")
+            except UnicodeEncodeError:
+                pass
+    try:
+        fp_store.update_many(contents)
+    except Exception:
+        pass
+
+
 # --- Collection tools ---
 
 
-@mcp.tool()
+@_tool
 def context_list_collections(
     limit: Optional[int] = None,
     offset: Optional[int] = None,
@@ -55,10 +128,10 @@ def context_list_collections(
     """List all collection names in the context store. Optional limit and offset for pagination."""
     _ensure_db()
     names = _get_store().list_collections(limit=limit, offset=offset)
-    return json.dumps({"collections": names})
+    return _dumps({"collections": names})
 
 
-@mcp.tool()
+@_tool
 def context_create_collection(
     collection_name: str,
     embedding_function_name: Optional[str] = None,
@@ -70,34 +143,34 @@ def context_create_collection(
     if embedding_function_name:
         meta["embedding_function"] = embedding_function_name
     _get_store().create_collection(collection_name, metadata=meta or None)
-    return json.dumps({"status": "ok", "collection": collection_name})
+    return _dumps({"status": "ok", "collection": collection_name})
 
 
-@mcp.tool()
+@_tool
 def context_get_collection_info(collection_name: str) -> str:
     """Get information about a collection (name, metadata, etc.)."""
     _ensure_db()
     info = _get_store().get_collection_info(collection_name)
-    return json.dumps(info)
+    return _dumps(info)
 
 
-@mcp.tool()
+@_tool
 def context_get_collection_count(collection_name: str) -> str:
     """Get the number of documents in a collection."""
     _ensure_db()
     count = _get_store().get_collection_count(collection_name)
-    return json.dumps({"count": count})
+    return _dumps({"count": count})
 
 
-@mcp.tool()
+@_tool
 def context_peek_collection(collection_name: str, limit: int = 5) -> str:
     """Peek at documents in a collection. Returns up to `limit` documents (default 5)."""
     _ensure_db()
     out = _get_store().peek(collection_name, limit=limit)
-    return json.dumps(out)
+    return _dumps(out)
 
 
-@mcp.tool()
+@_tool
 def context_add_documents(
     collection_name: str,
     documents: List[str],
@@ -109,17 +182,13 @@ def context_add_documents(
     store = _get_store()
     fp_store = _get_fingerprint_store()
     if len(documents) != len(ids):
-        return json.dumps({"error": "documents and ids must have the same length"})
+        return _dumps({"error": "documents and ids must have the same length"})
     n = store.add_documents(collection_name, ids, documents, metadatas=metadatas)
-    for i, doc_id in enumerate(ids):
-        try:
-            fp_store.update(doc_id, documents[i].encode("utf-8"))
-        except Exception:
-            pass
-    return json.dumps({"added": n})
+    _update_fingerprints(fp_store, ids, documents)
+    return _dumps({"added": n})
 
 
-@mcp.tool()
+@_tool
 def context_query_documents(
     collection_name: str,
     query_texts: List[str],
@@ -134,10 +203,10 @@ def context_query_documents(
         collection_name, query_texts, n_results=n_results,
         where=where, where_document=where_document, include=include,
     )
-    return json.dumps(result)
+    return _dumps(result)
 
 
-@mcp.tool()
+@_tool
 def context_get_documents(
     collection_name: str,
     ids: Optional[List[str]] = None,
@@ -153,10 +222,10 @@ def context_get_documents(
         collection_name, ids=ids, where=where, where_document=where_document,
         limit=limit, offset=offset, include=include,
     )
-    return json.dumps(result)
+    return _dumps(result)
 
 
-@mcp.tool()
+@_tool
 def context_update_documents(
     collection_name: str,
     ids: List[str],
@@ -169,24 +238,19 @@ def context_update_documents(
     fp_store = _get_fingerprint_store()
     n = store.update_documents(collection_name, ids, documents=documents, metadatas=metadatas)
     if documents is not None:
-        for i, doc_id in enumerate(ids):
-            if i < len(documents):
-                try:
-                    fp_store.update(doc_id, documents[i].encode("utf-8"))
-                except Exception:
-                    pass
-    return json.dumps({"updated": n})
+        _update_fingerprints(fp_store, ids, documents)
+    return _dumps({"updated": n})
 
 
-@mcp.tool()
+@_tool
 def context_delete_documents(collection_name: str, ids: List[str]) -> str:
     """Delete documents from a collection by id."""
     _ensure_db()
     n = _get_store().delete_documents(collection_name, ids)
-    return json.dumps({"deleted": n})
+    return _dumps({"deleted": n})
 
 
-@mcp.tool()
+@_tool
 def context_modify_collection(
     collection_name: str,
     new_name: Optional[str] = None,
@@ -197,19 +261,19 @@ def context_modify_collection(
     try:
         _get_store().modify_collection(collection_name, new_name=new_name, new_metadata=new_metadata)
     except Exception as e:
-        return json.dumps({"error": str(e), "metadata_updated": new_metadata is not None})
-    return json.dumps({"status": "ok"})
+        return _dumps({"error": str(e), "metadata_updated": new_metadata is not None})
+    return _dumps({"status": "ok"})
 
 
-@mcp.tool()
+@_tool
 def context_delete_collection(collection_name: str) -> str:
     """Delete a collection and all its documents."""
     _ensure_db()
     _get_store().delete_collection(collection_name)
-    return json.dumps({"status": "deleted", "collection": collection_name})
+    return _dumps({"status": "deleted", "collection": collection_name})
 
 
-@mcp.tool()
+@_tool
 def context_fork_collection(
     collection_name: str,
     new_collection_name: str,
@@ -218,29 +282,29 @@ def context_fork_collection(
     """Create a new collection with the same documents as the source. Optional metadata for the new collection."""
     _ensure_db()
     _get_store().fork_collection(collection_name, new_collection_name, metadata=metadata)
-    return json.dumps({"status": "ok", "new_collection": new_collection_name})
+    return _dumps({"status": "ok", "new_collection": new_collection_name})
 
 
 # --- Change detection tools ---
 
 
-@mcp.tool()
+@_tool
 def context_check_document_changed(file_path: str) -> str:
     """Check if a document (by relative file path, e.g. docs/rules/example.md) has changed since last index. Uses fingerprint store."""
     result = _get_fingerprint_store().has_changed(file_path)
-    return json.dumps(result)
+    return _dumps(result)
 
 
-@mcp.tool()
+@_tool
 def context_list_changed_documents(
     collection_name: Optional[str] = None,
     directories: Optional[List[str]] = None,
 ) -> str:
     """List file paths that need reindexing (changed or new). Optionally scope by collection_name or directories (e.g. [docs/rules, docs/features]). Returns changed_or_new and deleted lists."""
     result = _get_fingerprint_store().list_changed(collection_name=collection_name, directories=directories)
-    return json.dumps(result)
+    return _dumps(result)
 
 
 def run_mcp_server() -> None:
     """Run the MCP server with stdio transport (for Cursor/Claude)."""
-    mcp.run(transport="stdio")
+    get_mcp_server().run(transport="stdio")
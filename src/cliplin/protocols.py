@@ -6,7 +6,7 @@ See docs/rules/low-coupling-protocols.md.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, ContextManager, Dict, List, Optional, Protocol, Tuple
 
 
 class ContextStore(Protocol):
@@ -48,6 +48,10 @@ class ContextStore(Protocol):
         """Return True if a document with the given id exists in the collection."""
         ...
 
+    def get_existing_document_ids(self, collection_name: str, ids: List[str]) -> List[str]:
+        """Return the subset of ids that already exist in the collection (one lookup for all ids)."""
+        ...
+
     def add_documents(
         self,
         collection_name: str,
@@ -68,6 +72,16 @@ class ContextStore(Protocol):
         """Update documents by id. Return number updated."""
         ...
 
+    def upsert_documents(
+        self,
+        collection_name: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """Add documents, replacing those whose id already exists. Return number written."""
+        ...
+
     def query_documents(
         self,
         collection_name: str,
@@ -120,6 +134,29 @@ class ContextStore(Protocol):
         ...
 
 
+class FingerprintWriter(Protocol):
+    """Write side of the fingerprint store: record fingerprints of indexed content."""
+
+    def update(self, file_path: str, content: bytes) -> None:
+        """Update the stored fingerprint for file_path after indexing."""
+        ...
+
+    def update_many(
+        self,
+        contents: Dict[str, bytes],
+        file_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> None:
+        """
+        Update stored fingerprints for several file paths (file_path -> content). Optional file_stats
+        (file_path -> (st_mtime_ns, st_size) of the file read) let later checks skip unmodified files.
+        """
+        ...
+
+    def update_stats(self, file_stats: Dict[str, Tuple[int, int]]) -> None:
+        """Record (st_mtime_ns, st_size) for already fingerprinted files whose content was found unchanged."""
+        ...
+
+
 class FingerprintStore(Protocol):
     """Contract for the fingerprint store (change detection). Implementation-agnostic."""
 
@@ -127,6 +164,21 @@ class FingerprintStore(Protocol):
         """Update the stored fingerprint for file_path after indexing."""
         ...
 
+    def update_many(
+        self,
+        contents: Dict[str, bytes],
+        file_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> None:
+        """
+        Update stored fingerprints for several file paths (file_path -> content) in one write.
+        Optional file_stats as in FingerprintWriter.update_many.
+        """
+        ...
+
+    def batch(self) -> ContextManager[FingerprintWriter]:
+        """Collect updates made through the yielded writer and persist them in one write when the block exits."""
+        ...
+
     def has_changed(
         self,
         file_path: str,
@@ -135,6 +187,16 @@ class FingerprintStore(Protocol):
         """Return dict with changed (bool), current_fingerprint, stored_fingerprint, exists_on_disk."""
         ...
 
+    def has_changed_many(
+        self,
+        entries: List[Tuple[str, Path]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Batch has_changed for (file_path, file_system_path) pairs. Return dict file_path -> has_changed
+        result, each also carrying file_stat: (st_mtime_ns, st_size) taken before hashing, or None.
+        """
+        ...
+
     def list_changed(
         self,
         collection_name: Optional[str] = None,
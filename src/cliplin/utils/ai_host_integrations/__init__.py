@@ -6,14 +6,27 @@ from cliplin.utils.ai_host_integrations.base import (
     AiHostIntegration,
     get_integration,
     get_known_ai_tool_ids,
+    get_known_ai_tool_ids_set,
     register_integration,
 )
-from cliplin.utils.ai_host_integrations.claude_desktop import ClaudeDesktopIntegration
-from cliplin.utils.ai_host_integrations.cursor import CursorIntegration
 
-# Register built-in integrations so create_ai_tool_config and validate can resolve by id
-register_integration(CursorIntegration())
-register_integration(ClaudeDesktopIntegration())
+
+def _cursor_integration() -> AiHostIntegration:
+    from cliplin.utils.ai_host_integrations.cursor import CursorIntegration
+
+    return CursorIntegration()
+
+
+def _claude_desktop_integration() -> AiHostIntegration:
+    from cliplin.utils.ai_host_integrations.claude_desktop import ClaudeDesktopIntegration
+
+    return ClaudeDesktopIntegration()
+
+
+# Register built-in integrations so create_ai_tool_config and validate can resolve by id;
+# host modules (Rich, templates) are imported only when a handler is requested
+register_integration("cursor", _cursor_integration)
+register_integration("claude-desktop", _claude_desktop_integration)
 
 
 def create_ai_tool_config(target_dir: Path, ai_tool: str) -> None:
@@ -31,4 +44,5 @@ __all__ = [
     "create_ai_tool_config",
     "get_integration",
     "get_known_ai_tool_ids",
+    "get_known_ai_tool_ids_set",
 ]
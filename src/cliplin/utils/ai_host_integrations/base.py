@@ -1,7 +1,7 @@
 """Protocol and registry for AI host integrations (one class per host)."""
 
 from pathlib import Path
-from typing import Dict, List, Optional, Protocol, runtime_checkable
+from typing import Callable, Dict, FrozenSet, List, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -28,12 +28,19 @@ class AiHostIntegration(Protocol):
         ...
 
 
-_REGISTRY: Dict[str, AiHostIntegration] = {}
+# ai_tool id -> factory; a handler (and its module) is only built when first requested
+_REGISTRY: Dict[str, Callable[[], AiHostIntegration]] = {}
+_INSTANCES: Dict[str, AiHostIntegration] = {}
+# Registered ids for membership tests; rebuilt on every registration
+_KNOWN_IDS: FrozenSet[str] = frozenset()
 
 
-def register_integration(integration: AiHostIntegration) -> None:
-    """Register an AI host integration by its id."""
-    _REGISTRY[integration.id] = integration
+def register_integration(ai_tool: str, factory: Callable[[], AiHostIntegration]) -> None:
+    """Register the factory of an AI host integration under its id."""
+    global _KNOWN_IDS
+    _REGISTRY[ai_tool] = factory
+    _INSTANCES.pop(ai_tool, None)
+    _KNOWN_IDS = frozenset(_REGISTRY)
 
 
 def get_known_ai_tool_ids() -> List[str]:
@@ -41,6 +48,17 @@ def get_known_ai_tool_ids() -> List[str]:
     return list(_REGISTRY.keys())
 
 
+def get_known_ai_tool_ids_set() -> FrozenSet[str]:
+    """Return the known AI tool ids as a frozenset (for membership tests)."""
+    return _KNOWN_IDS
+
+
 def get_integration(ai_tool: str) -> Optional[AiHostIntegration]:
-    """Return the integration for the given ai_tool id, or None if unknown."""
-    return _REGISTRY.get(ai_tool)
+    """Return the integration for the given ai_tool id (built on first use), or None if unknown."""
+    integration = _INSTANCES.get(ai_tool)
+    if integration is None:
+        factory = _REGISTRY.get(ai_tool)
+        if factory is None:
+            return None
+        integration = _INSTANCES[ai_tool] = factory()
+    return integration
@@ -17,6 +17,15 @@ class ClaudeDesktopIntegration:
     id = "claude-desktop"
     rules_dir = ".claude/rules"
     mcp_config_path = ".mcp.json"
+    # Files written by apply(): (path relative to project root, content getter)
+    rule_files = (
+        (".claude/rules/feature-processing.md", templates.get_cursor_feature_processing_content),
+        (".claude/rules/context-protocol-loading.md", templates.get_cursor_context_protocol_loading_content),
+        (".claude/rules/feature-first-flow.md", templates.get_feature_first_flow_content),
+        (".claude/rules/context.md", templates.get_cursor_context_content),
+        (".claude/instructions.md", templates.get_claude_desktop_instructions_content),
+        (".claude/claude.md", templates.get_claude_desktop_claude_md_content),
+    )
 
     def apply(self, target_dir: Path) -> None:
         target_dir = Path(target_dir)
@@ -25,41 +34,11 @@ class ClaudeDesktopIntegration:
 
         templates.create_claude_desktop_mcp_config(target_dir)
 
-        feature_file_path = ".claude/rules/feature-processing.md"
-        (target_dir / feature_file_path).write_text(
-            templates.get_cursor_feature_processing_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {feature_file_path}")
-
-        protocol_file_path = ".claude/rules/context-protocol-loading.md"
-        (target_dir / protocol_file_path).write_text(
-            templates.get_cursor_context_protocol_loading_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {protocol_file_path}")
-
-        flow_file_path = ".claude/rules/feature-first-flow.md"
-        (target_dir / flow_file_path).write_text(
-            templates.get_feature_first_flow_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {flow_file_path}")
-
-        context_file_path = ".claude/rules/context.md"
-        (target_dir / context_file_path).write_text(
-            templates.get_cursor_context_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {context_file_path}")
-
-        instructions_path = ".claude/instructions.md"
-        (target_dir / instructions_path).write_text(
-            templates.get_claude_desktop_instructions_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {instructions_path}")
-
-        claude_md_path = ".claude/claude.md"
-        (target_dir / claude_md_path).write_text(
-            templates.get_claude_desktop_claude_md_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {claude_md_path}")
+        created = []
+        for rel_path, get_content in self.rule_files:
+            (target_dir / rel_path).write_text(get_content(), encoding="utf-8")
+            created.append(rel_path)
+        console.print("\n".join(f"  [green]✓[/green] Created {rel_path}" for rel_path in created))
 
     def link_knowledge_skills(self, project_root: Path, package_path: Path) -> None:
         """Create hard links from skill folders (those containing SKILL.md) to .claude/skills/ so Claude sees them.
@@ -82,18 +61,15 @@ class ClaudeDesktopIntegration:
             if dst_folder.exists():
                 shutil.rmtree(dst_folder)
             dst_folder.mkdir(parents=True, exist_ok=True)
-            for src_file in skill_dir.rglob("*"):
-                if not src_file.is_file():
+            # os.walk lists each directory once (one scandir) and does not follow symlinked dirs
+            for dirpath, _, filenames in os.walk(skill_dir):
+                if not filenames:
                     continue
-                rel = src_file.relative_to(skill_dir)
-                dst_file = dst_folder / rel
-                dst_file.parent.mkdir(parents=True, exist_ok=True)
-                if dst_file.exists():
-                    dst_file.unlink()
-                try:
-                    os.link(src_file, dst_file)
-                except OSError:
-                    pass  # e.g. cross-filesystem: skip; hard links only
+                rel_dir = os.path.relpath(dirpath, skill_dir)
+                dst_dir = os.path.join(dst_folder, rel_dir) if rel_dir != "." else str(dst_folder)
+                os.makedirs(dst_dir, exist_ok=True)
+                for name in filenames:
+                    _hard_link(os.path.join(dirpath, name), os.path.join(dst_dir, name))
 
     def unlink_knowledge_skills(self, project_root: Path, package_path: Path) -> None:
         """Remove from .claude/skills/ the skill folders that were linked from this package.
@@ -112,3 +88,17 @@ class ClaudeDesktopIntegration:
             dst_folder = skills_dst_root / name
             if dst_folder.exists():
                 shutil.rmtree(dst_folder)
+
+
+def _hard_link(src: str, dst: str) -> None:
+    """Hard-link src to dst, replacing an existing dst; skipped where hard links fail (e.g. cross-filesystem)."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        os.unlink(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            pass
+    except OSError:
+        pass  # e.g. cross-filesystem: skip; hard links only
@@ -15,6 +15,13 @@ class CursorIntegration:
     id = "cursor"
     rules_dir = ".cursor/rules"
     mcp_config_path = ".cursor/mcp.json"
+    # Files written by apply(): (path relative to project root, content getter)
+    rule_files = (
+        (".cursor/rules/context.mdc", templates.get_cursor_context_content),
+        (".cursor/rules/feature-processing.mdc", templates.get_cursor_feature_processing_content),
+        (".cursor/rules/context-protocol-loading.mdc", templates.get_cursor_context_protocol_loading_content),
+        (".cursor/rules/feature-first-flow.mdc", templates.get_feature_first_flow_content),
+    )
 
     def apply(self, target_dir: Path) -> None:
         target_dir = Path(target_dir)
@@ -23,25 +30,8 @@ class CursorIntegration:
 
         templates.create_cursor_mcp_config(target_dir)
 
-        config_file = ".cursor/rules/context.mdc"
-        context_file = target_dir / config_file
-        context_file.write_text(templates.get_cursor_context_content(), encoding="utf-8")
-        console.print(f"  [green]✓[/green] Created {config_file}")
-
-        feature_file_path = ".cursor/rules/feature-processing.mdc"
-        (target_dir / feature_file_path).write_text(
-            templates.get_cursor_feature_processing_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {feature_file_path}")
-
-        protocol_file_path = ".cursor/rules/context-protocol-loading.mdc"
-        (target_dir / protocol_file_path).write_text(
-            templates.get_cursor_context_protocol_loading_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {protocol_file_path}")
-
-        flow_file_path = ".cursor/rules/feature-first-flow.mdc"
-        (target_dir / flow_file_path).write_text(
-            templates.get_feature_first_flow_content(), encoding="utf-8"
-        )
-        console.print(f"  [green]✓[/green] Created {flow_file_path}")
+        created = []
+        for rel_path, get_content in self.rule_files:
+            (target_dir / rel_path).write_text(get_content(), encoding="utf-8")
+            created.append(rel_path)
+        console.print("\n".join(f"  [green]✓[/green] Created {rel_path}" for rel_path in created))
@@ -1,15 +1,19 @@
 """ChromaDB utilities for Cliplin. Concrete implementation of ContextStore protocol."""
 
 import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-import chromadb
-from chromadb.config import Settings
 from rich.console import Console
 
 from cliplin.protocols import ContextStore
 
+if TYPE_CHECKING:
+    import chromadb
+
 console = Console()
 
 # Collection mappings
@@ -55,22 +59,36 @@ KNOWLEDGE_PATH_MAPPINGS: List[Tuple[str, str, str, str]] = [
 ]
 
 
+@lru_cache(maxsize=8)
 def get_chromadb_path(project_root: Path) -> Path:
-    """Get the ChromaDB database path for a project."""
+    """Get the ChromaDB database path for a project. Memoized per project_root."""
     return project_root / ".cliplin" / "data" / "context" / "chroma.sqlite3"
 
 
-def get_chromadb_client(project_root: Path) -> chromadb.Client:
-    """Get or create a ChromaDB client for a project."""
-    db_path = get_chromadb_path(project_root)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    
+def get_chromadb_client(project_root: Path) -> "chromadb.Client":
+    """Get or create a ChromaDB client for a project. One client per database directory per process."""
+    return _get_chromadb_client_for(_chromadb_dir(project_root))
+
+
+@lru_cache(maxsize=8)
+def _chromadb_dir(project_root: Path) -> str:
+    """Create the database directory and return its resolved path. Memoized per project_root."""
+    db_dir = get_chromadb_path(project_root).parent
+    db_dir.mkdir(parents=True, exist_ok=True)
     # Convert to absolute path and resolve for Windows compatibility
-    absolute_path = db_path.parent.resolve()
-    
+    return os.fspath(db_dir.resolve())
+
+
+@lru_cache(maxsize=8)
+def _get_chromadb_client_for(absolute_path: str) -> "chromadb.Client":
+    """Memoized by resolved database directory (failures are not cached)."""
+    # Imported on first client: path classification and fingerprint checks never load chromadb
+    import chromadb
+    from chromadb.config import Settings
+
     try:
         return chromadb.PersistentClient(
-            path=str(absolute_path),
+            path=absolute_path,
             settings=Settings(
                 anonymized_telemetry=False,
                 allow_reset=True,
@@ -82,7 +100,7 @@ def get_chromadb_client(project_root: Path) -> chromadb.Client:
         raise
 
 
-def initialize_collections(client: chromadb.Client) -> None:
+def initialize_collections(client: "chromadb.Client") -> None:
     """Initialize all required ChromaDB collections."""
     for collection_name in REQUIRED_COLLECTIONS:
         try:
@@ -96,67 +114,112 @@ def initialize_collections(client: chromadb.Client) -> None:
             raise
 
 
-def verify_collections(client: chromadb.Client) -> List[str]:
+def verify_collections(client: "chromadb.Client") -> List[str]:
     """Verify that all required collections exist."""
     existing_collections = [col.name for col in client.list_collections()]
     missing = [col for col in REQUIRED_COLLECTIONS if col not in existing_collections]
     return missing
 
 
-def _path_under_knowledge_package(relative_path_str: str) -> Optional[str]:
-    """If path is under .cliplin/knowledge/<pkg_dir>/..., return path under package (e.g. docs/adrs/001.md)."""
-    normalized = relative_path_str.replace("\\", "/")
-    if not normalized.startswith(".cliplin/knowledge/"):
-        return None
-    parts = normalized.split("/")
-    if len(parts) < 4:  # .cliplin, knowledge, <pkg_dir>, ...
-        return None
-    return "/".join(parts[3:])
+FileNameMatcher = Callable[[str], Optional["re.Match[str]"]]
 
 
-def get_collection_for_file(file_path: Path, project_root: Path) -> Optional[str]:
-    """Determine the ChromaDB collection for a given file path."""
-    relative_path = file_path.relative_to(project_root)
-    rel_str = str(relative_path).replace("\\", "/")
-    name = file_path.name
-
-    # Check knowledge package paths first
-    path_under_pkg = _path_under_knowledge_package(rel_str)
-    if path_under_pkg is not None:
-        for path_seg, file_pattern, collection_name, _ in KNOWLEDGE_PATH_MAPPINGS:
-            if path_under_pkg == path_seg or path_under_pkg.startswith(path_seg + "/"):
-                if fnmatch.fnmatch(name, file_pattern):
-                    return collection_name
-        return None
+@lru_cache(maxsize=None)
+def file_pattern_matcher(file_pattern: str) -> FileNameMatcher:
+    """
+    Compiled equivalent of fnmatch.fnmatch(name, file_pattern): returns a callable taking a file
+    name, truthy on match. Case-insensitive where the OS normalizes case (as fnmatch does).
+    """
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(file_pattern), flags).match
+
 
+def walk_context_files(dir_path: Path, file_pattern: str) -> Iterator[Path]:
+    """
+    Yield files under dir_path whose name matches file_pattern, in a single os.scandir traversal.
+    Symlinked directories and .git are not descended; a missing dir_path yields nothing.
+    """
+    matches = file_pattern_matcher(file_pattern)
+    stack = [str(dir_path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != ".git":
+                        stack.append(entry.path)
+                elif matches(entry.name) and entry.is_file():
+                    yield Path(entry.path)
+
+
+# Classification tables derived once from the mappings above (read for every indexed file).
+# Project docs: top-level directory -> [(directory prefix, file name matcher, collection_name, type)],
+# each list in COLLECTION_MAPPINGS order, so a path is only tested against rules sharing its first segment.
+def _index_project_path_rules() -> Dict[str, List[Tuple[str, FileNameMatcher, str, str]]]:
+    rules: Dict[str, List[Tuple[str, FileNameMatcher, str, str]]] = {}
     for collection_name, mapping in COLLECTION_MAPPINGS.items():
+        matches = file_pattern_matcher(mapping["file_pattern"])
         for directory in mapping["directories"]:
-            if rel_str.startswith(directory.replace("\\", "/")):
-                if file_path.match(mapping["file_pattern"]):
-                    return collection_name
+            directory = directory.replace("\\", "/")
+            rules.setdefault(directory.split("/", 1)[0], []).append(
+                (directory, matches, collection_name, mapping["type"])
+            )
+    return rules
+
+
+_PROJECT_PATH_RULES = _index_project_path_rules()
+# Knowledge packages: path segment under package -> (file name matcher, collection_name, type).
+_KNOWLEDGE_SEGMENT_RULES: Dict[str, Tuple[FileNameMatcher, str, str]] = {
+    path_seg: (file_pattern_matcher(file_pattern), collection_name, type_name)
+    for path_seg, file_pattern, collection_name, type_name in KNOWLEDGE_PATH_MAPPINGS
+}
+# Deepest segment first, so the longest matching prefix wins
+_KNOWLEDGE_SEGMENT_DEPTHS = sorted({seg.count("/") + 1 for seg in _KNOWLEDGE_SEGMENT_RULES}, reverse=True)
+
+
+def classify_context_file(relative_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Return (collection_name, type) for a path relative to the project root (posix separators),
+    or None if the file does not belong to any context collection.
+    """
+    name = relative_path.rsplit("/", 1)[-1]
+    top_dir, _, rest = relative_path.partition("/")
+
+    # Check knowledge package paths first: .cliplin/knowledge/<pkg_dir>/<path under package>
+    if top_dir == ".cliplin" and rest.startswith("knowledge/"):
+        under_knowledge = rest.split("/", 2)
+        if len(under_knowledge) == 3:
+            parts = under_knowledge[2].split("/")
+            for depth in _KNOWLEDGE_SEGMENT_DEPTHS:
+                rule = _KNOWLEDGE_SEGMENT_RULES.get("/".join(parts[:depth]))
+                if rule is not None:
+                    matches, collection_name, type_name = rule
+                    return (collection_name, type_name) if matches(name) else None
+            return None
+
+    for directory, matches, collection_name, type_name in _PROJECT_PATH_RULES.get(top_dir, ()):
+        if relative_path.startswith(directory) and matches(name):
+            return collection_name, type_name
     return None
 
 
+def get_collection_for_file(file_path: Path, project_root: Path) -> Optional[str]:
+    """Determine the ChromaDB collection for a given file path."""
+    classified = classify_context_file(file_path.relative_to(project_root).as_posix())
+    return classified[0] if classified else None
+
+
 def get_file_type(file_path: Path, project_root: Path) -> Optional[str]:
     """Get the file type based on path and collection mapping."""
-    relative_path = file_path.relative_to(project_root)
-    rel_str = str(relative_path).replace("\\", "/")
-    name = file_path.name
-
-    path_under_pkg = _path_under_knowledge_package(rel_str)
-    if path_under_pkg is not None:
-        for path_seg, file_pattern, _, type_name in KNOWLEDGE_PATH_MAPPINGS:
-            if path_under_pkg == path_seg or path_under_pkg.startswith(path_seg + "/"):
-                if fnmatch.fnmatch(name, file_pattern):
-                    return type_name
-        return None
+    classified = classify_context_file(file_path.relative_to(project_root).as_posix())
+    return classified[1] if classified else None
 
-    for collection_name, mapping in COLLECTION_MAPPINGS.items():
-        for directory in mapping["directories"]:
-            if rel_str.startswith(directory.replace("\\", "/")):
-                if file_path.match(mapping["file_pattern"]):
-                    return mapping["type"]
-    return None
+
+# Records per get/add call when paging through a collection (below Chroma's max batch size)
+STORE_PAGE_SIZE = 5000
 
 
 def get_document_ids_by_file_path_prefix(
@@ -165,30 +228,40 @@ def get_document_ids_by_file_path_prefix(
     """
     Return document IDs in each collection whose file_path metadata starts with prefix.
     Used when removing a knowledge package to delete its documents from the context store.
+    Chroma has no server-side string prefix filter, so only metadatas are fetched and filtered
+    here; documents are never loaded. Store errors propagate rather than truncating the result.
     """
     result: Dict[str, List[str]] = {}
     for collection_name in REQUIRED_COLLECTIONS:
-        try:
+        matching: List[str] = []
+        offset = 0
+        # Metadatas are read a page at a time, so memory does not grow with the collection
+        while True:
             data = store.get_documents(
-                collection_name,
-                limit=10000,
-                include=["metadatas"],
+                collection_name, include=["metadatas"], limit=STORE_PAGE_SIZE, offset=offset
             )
-        except Exception:
-            continue
-        ids = data.get("ids") or []
-        metadatas = data.get("metadatas") or []
-        matching = []
-        for i, doc_id in enumerate(ids):
-            meta = metadatas[i] if i < len(metadatas) else {}
-            fp = meta.get("file_path") or ""
-            if fp.startswith(prefix):
-                matching.append(doc_id)
+            ids = data.get("ids") or []
+            metadatas = data.get("metadatas") or []
+            for i, doc_id in enumerate(ids):
+                meta = (metadatas[i] if i < len(metadatas) else None) or {}
+                if (meta.get("file_path") or "").startswith(prefix):
+                    matching.append(doc_id)
+            if len(ids) < STORE_PAGE_SIZE:
+                break
+            offset += len(ids)
         if matching:
             result[collection_name] = matching
     return result
 
 
+def _collection_not_found_errors() -> Tuple[type, ...]:
+    """Exceptions get_collection raises for a missing collection (NotFoundError in chromadb 1.x, ValueError before)."""
+    import chromadb.errors
+
+    not_found = getattr(chromadb.errors, "NotFoundError", None)
+    return (not_found, ValueError) if not_found is not None else (ValueError,)
+
+
 # --- Concrete implementation of ContextStore (low coupling) ---
 
 
@@ -197,15 +270,19 @@ class ChromaDBContextStore:
 
     def __init__(self, project_root: Path) -> None:
         self._project_root = project_root
-        self._client: Optional[chromadb.Client] = None
+        self._client: Optional["chromadb.Client"] = None
+        self._initialized = False
 
-    def _client_or_raise(self) -> chromadb.Client:
+    def _client_or_raise(self) -> "chromadb.Client":
         if self._client is None:
             self._client = get_chromadb_client(self._project_root)
         return self._client
 
     def is_initialized(self) -> bool:
-        return get_chromadb_path(self._project_root).exists()
+        # Only a positive result is cached: the database may be created later by a long-lived process (MCP)
+        if not self._initialized:
+            self._initialized = get_chromadb_path(self._project_root).exists()
+        return self._initialized
 
     def ensure_collections(self) -> List[str]:
         client = self._client_or_raise()
@@ -258,6 +335,17 @@ class ChromaDBContextStore:
         except Exception:
             return False
 
+    def get_existing_document_ids(self, collection_name: str, ids: List[str]) -> List[str]:
+        if not ids:
+            return []
+        client = self._client_or_raise()
+        try:
+            col = client.get_collection(name=collection_name)
+        except _collection_not_found_errors():
+            # No collection yet: none of the ids exist. Other failures reach the caller
+            return []
+        return list(col.get(ids=ids, include=[])["ids"])
+
     def add_documents(
         self,
         collection_name: str,
@@ -289,6 +377,21 @@ class ChromaDBContextStore:
         col.update(**kwargs)
         return len(ids)
 
+    def upsert_documents(
+        self,
+        collection_name: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        metadatas = metadatas or [{}] * len(ids)
+        if len(metadatas) != len(ids):
+            metadatas = [{}] * len(ids)
+        self._client_or_raise().get_collection(name=collection_name).upsert(
+            ids=ids, documents=documents, metadatas=metadatas
+        )
+        return len(ids)
+
     def query_documents(
         self,
         collection_name: str,
@@ -322,7 +425,8 @@ class ChromaDBContextStore:
         include: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         col = self._client_or_raise().get_collection(name=collection_name)
-        include = include or ["documents", "metadatas"]
+        # include=[] fetches IDs only
+        include = include if include is not None else ["documents", "metadatas"]
         kwargs: Dict[str, Any] = {"include": include}
         if ids is not None:
             kwargs["ids"] = ids
@@ -363,19 +467,26 @@ class ChromaDBContextStore:
     ) -> None:
         client = self._client_or_raise()
         col = client.get_collection(name=collection_name)
-        data = col.get(include=["documents", "metadatas"])
         try:
             client.delete_collection(name=new_collection_name)
         except Exception:
             pass
-        new_col = client.create_collection(name=new_collection_name, metadata=metadata or {})
-        ids = data.get("ids") or []
-        if ids:
+        new_col = client.create_collection(name=new_collection_name, metadata=metadata or None)
+        # Copy page by page: bounds memory and stays under Chroma's max batch size
+        offset = 0
+        while True:
+            data = col.get(
+                limit=STORE_PAGE_SIZE, offset=offset, include=["documents", "metadatas"]
+            )
+            ids = data.get("ids") or []
+            if not ids:
+                break
             new_col.add(
                 ids=ids,
                 documents=data.get("documents") or [""] * len(ids),
                 metadatas=data.get("metadatas") or [{}] * len(ids),
             )
+            offset += len(ids)
 
 
 def get_context_store(project_root: Path) -> ContextStore:
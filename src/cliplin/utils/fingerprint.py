@@ -3,10 +3,21 @@
 import datetime
 import hashlib
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from cliplin.protocols import FingerprintStore
+from cliplin.protocols import FingerprintStore, FingerprintWriter
+
+# orjson (installed with chromadb) parses and encodes large stores much faster than json
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 # Encoding for all file I/O (see windows-compatibility-file-operations.md)
 ENCODING = "utf-8"
@@ -22,25 +33,60 @@ def compute_fingerprint(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+def compute_fingerprint_path(path: Path) -> str:
+    """Fingerprint of a file's content, streamed from disk; same digest as compute_fingerprint."""
+    with open(path, "rb") as f:
+        if _file_digest is not None:
+            return _file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+# hashlib.file_digest (Python 3.11+) hashes straight from the file without Python-level chunking
+_file_digest = getattr(hashlib, "file_digest", None)
+# Read size for streaming file contents into the hash (Python 3.10 fallback)
+_HASH_CHUNK_SIZE = 1 << 20
+
+
 def load_fingerprint_store(project_root: Path) -> Dict[str, Dict[str, Any]]:
-    """Load fingerprint store from disk. Returns dict mapping file_path -> {fingerprint, last_indexed_at?}."""
+    """
+    Load fingerprint store from disk. Returns dict mapping file_path ->
+    {fingerprint, last_indexed_at?, mtime_ns?, size?} (mtime_ns/size of the file that was indexed, if known).
+    """
     path = get_fingerprint_store_path(project_root)
     if not path.exists():
         return {}
     try:
-        data = path.read_text(encoding=ENCODING)
-        return json.loads(data)
-    except (json.JSONDecodeError, OSError):
+        data = path.read_bytes()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data) if orjson is not None else json.loads(data.decode(ENCODING))
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return {}
 
 
 def save_fingerprint_store(
     project_root: Path, store: Dict[str, Dict[str, Any]]
 ) -> None:
-    """Persist fingerprint store to disk."""
+    """
+    Persist fingerprint store to disk as compact JSON. Written to a temporary file and renamed over
+    the store, so an interrupted save leaves the previous store intact.
+    """
     path = get_fingerprint_store_path(project_root)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(store, indent=2), encoding=ENCODING)
+    if orjson is not None:
+        data = orjson.dumps(store)
+    else:
+        data = json.dumps(store, separators=(",", ":"), ensure_ascii=False).encode(ENCODING)
+    # Unique per process and thread: the MCP server and the CLI may save concurrently
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def remove_fingerprints_by_prefix(project_root: Path, prefix: str) -> int:
@@ -49,12 +95,11 @@ def remove_fingerprints_by_prefix(project_root: Path, prefix: str) -> int:
     Returns the number of entries removed. Used when removing a knowledge package.
     """
     store = load_fingerprint_store(project_root)
-    to_remove = [k for k in store if k.startswith(prefix)]
-    for k in to_remove:
-        del store[k]
-    if to_remove:
-        save_fingerprint_store(project_root, store)
-    return len(to_remove)
+    kept = {k: v for k, v in store.items() if not k.startswith(prefix)}
+    removed = len(store) - len(kept)
+    if removed:
+        save_fingerprint_store(project_root, kept)
+    return removed
 
 
 def update_fingerprint(
@@ -70,9 +115,7 @@ def update_fingerprint(
     """
     if content is None and file_system_path is None:
         raise ValueError("Provide content or file_system_path")
-    if content is None:
-        content = file_system_path.read_bytes()
-    fp = compute_fingerprint(content)
+    fp = compute_fingerprint(content) if content is not None else compute_fingerprint_path(file_system_path)
     store = load_fingerprint_store(project_root)
     store[file_path] = {
         "fingerprint": fp,
@@ -81,6 +124,56 @@ def update_fingerprint(
     save_fingerprint_store(project_root, store)
 
 
+def update_fingerprints(
+    project_root: Path,
+    contents: Dict[str, bytes],
+    file_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+) -> None:
+    """
+    Update fingerprints for several documents after indexing, with a single load/save of the store.
+    contents maps file_path (relative to project root) -> indexed content bytes.
+    file_stats optionally maps file_path -> (st_mtime_ns, st_size) of the file the content was read
+    from (taken before reading); later checks skip hashing that file while both still match.
+    """
+    _save_fingerprints(
+        project_root,
+        {file_path: compute_fingerprint(content) for file_path, content in contents.items()},
+        file_stats,
+    )
+
+
+def _save_fingerprints(
+    project_root: Path,
+    fingerprints: Dict[str, str],
+    file_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+    unchanged_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+) -> None:
+    """
+    Record precomputed fingerprints (file_path -> fingerprint) with a single load/save of the store.
+    unchanged_stats refreshes mtime_ns/size of entries whose content was found unchanged; the store
+    is not rewritten when that is all there is and nothing differs.
+    """
+    if not fingerprints and not unchanged_stats:
+        return
+    file_stats = file_stats or {}
+    store = load_fingerprint_store(project_root)
+    dirty = bool(fingerprints)
+    for file_path, (mtime_ns, size) in (unchanged_stats or {}).items():
+        entry = store.get(file_path)
+        if entry is not None and (entry.get("mtime_ns"), entry.get("size")) != (mtime_ns, size):
+            entry["mtime_ns"], entry["size"] = mtime_ns, size
+            dirty = True
+    now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    for file_path, fp in fingerprints.items():
+        entry = {"fingerprint": fp, "last_indexed_at": now}
+        file_stat = file_stats.get(file_path)
+        if file_stat is not None:
+            entry["mtime_ns"], entry["size"] = file_stat
+        store[file_path] = entry
+    if dirty:
+        save_fingerprint_store(project_root, store)
+
+
 def has_document_changed(
     project_root: Path,
     file_path: str,
@@ -91,8 +184,98 @@ def has_document_changed(
     file_path: relative path (e.g. docs/rules/example.md).
     Returns dict with keys: changed (bool), current_fingerprint (str|None), stored_fingerprint (str|None), exists_on_disk (bool).
     """
-    path = file_system_path or (project_root / file_path)
-    store = load_fingerprint_store(project_root)
+    return _document_change_result(
+        load_fingerprint_store(project_root),
+        file_path,
+        file_system_path or (project_root / file_path),
+    )
+
+
+def have_documents_changed(
+    project_root: Path,
+    entries: List[Tuple[str, Path]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Batch version of has_document_changed: loads the fingerprint store once.
+    entries: (file_path relative to project root, file system path) pairs.
+    Returns dict mapping file_path -> has_document_changed result, plus file_stat: (st_mtime_ns, st_size)
+    taken before the file was hashed, or None. A file that exists but cannot be read is reported as
+    changed (current_fingerprint None) instead of failing the batch.
+    Files are hashed on a shared thread pool when there are enough of them.
+    """
+    return _changes_against_store(load_fingerprint_store(project_root), entries)
+
+
+def _changes_against_store(
+    store: Dict[str, Dict[str, Any]],
+    entries: List[Tuple[str, Path]],
+) -> Dict[str, Dict[str, Any]]:
+    """have_documents_changed against an already loaded fingerprint store."""
+    paths = [path for _, path in entries]
+    stored_entries = [store.get(file_path) for file_path, _ in entries]
+    # hashlib releases the GIL while hashing, so files are read and hashed concurrently
+    if len(paths) >= _PARALLEL_HASH_MIN_FILES:
+        fingerprints = list(_hash_executor().map(_try_fingerprint_file, paths, stored_entries))
+    else:
+        fingerprints = [_try_fingerprint_file(path, stored) for path, stored in zip(paths, stored_entries)]
+    results: Dict[str, Dict[str, Any]] = {}
+    for (file_path, _), stored, (exists_on_disk, current_fp, file_stat) in zip(
+        entries, stored_entries, fingerprints
+    ):
+        stored_fp = stored.get("fingerprint") if stored else None
+        results[file_path] = {
+            "changed": current_fp is None or stored_fp is None or current_fp != stored_fp,
+            "current_fingerprint": current_fp,
+            "stored_fingerprint": stored_fp,
+            "exists_on_disk": exists_on_disk,
+            "file_stat": file_stat,
+        }
+    return results
+
+
+# Below this many files the thread handoff costs more than it saves
+_PARALLEL_HASH_MIN_FILES = 8
+
+
+@lru_cache(maxsize=1)
+def _hash_executor() -> ThreadPoolExecutor:
+    """Shared pool for file hashing (created on first use; bounded even when callers are themselves threaded)."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="cliplin-hash")
+
+
+def _unchanged_stored_fingerprint(
+    stored: Optional[Dict[str, Any]], st: os.stat_result
+) -> Optional[str]:
+    """Stored fingerprint if the file's mtime and size still match the indexed file (quick check), else None."""
+    if stored and stored.get("mtime_ns") == st.st_mtime_ns and stored.get("size") == st.st_size:
+        return stored.get("fingerprint")
+    return None
+
+
+def _try_fingerprint_file(
+    path: Path, stored: Optional[Dict[str, Any]] = None
+) -> Tuple[bool, Optional[str], Optional[Tuple[int, int]]]:
+    """
+    Return (exists_on_disk, fingerprint, (st_mtime_ns, st_size)) streaming the file; same digest as
+    compute_fingerprint. The file is not read when its mtime and size match the stored entry.
+    Missing file -> (False, None, None); existing but unreadable -> (True, None, stat or None).
+    """
+    file_stat = None
+    try:
+        st = os.stat(path)
+        file_stat = (st.st_mtime_ns, st.st_size)
+        fp = _unchanged_stored_fingerprint(stored, st)
+        return True, fp if fp is not None else compute_fingerprint_path(path), file_stat
+    except FileNotFoundError:
+        return False, None, None
+    except OSError:
+        return True, None, file_stat
+
+
+def _document_change_result(
+    store: Dict[str, Dict[str, Any]], file_path: str, path: Path
+) -> Dict[str, Any]:
+    """Compare the file on disk against the stored fingerprint for file_path."""
     stored = store.get(file_path)
 
     if not path.exists():
@@ -103,7 +286,7 @@ def has_document_changed(
             "exists_on_disk": False,
         }
 
-    current_fp = compute_fingerprint(path.read_bytes())
+    current_fp = _unchanged_stored_fingerprint(stored, path.stat()) or compute_fingerprint_path(path)
     stored_fp = stored.get("fingerprint") if stored else None
 
     return {
@@ -119,38 +302,35 @@ def _collect_context_files(
     collection_name: Optional[str] = None,
     directories: Optional[List[str]] = None,
 ) -> List[Path]:
-    """Return list of context file paths to consider. Uses COLLECTION_MAPPINGS."""
-    from cliplin.utils.chromadb import COLLECTION_MAPPINGS
+    """
+    Return list of context file paths to consider. Uses COLLECTION_MAPPINGS.
+    Each directory is walked once, with the same traversal as reindex.
+    """
+    from cliplin.utils.chromadb import COLLECTION_MAPPINGS, walk_context_files
 
+    # (directory, file_pattern) to walk; dict keeps order and drops repeated directories
+    roots: Dict[str, str] = {}
     if collection_name:
         if collection_name not in COLLECTION_MAPPINGS:
             return []
         mapping = COLLECTION_MAPPINGS[collection_name]
-        files: List[Path] = []
         for d in mapping["directories"]:
-            dir_path = project_root / d
-            if dir_path.exists():
-                files.extend(dir_path.rglob(mapping["file_pattern"]))
-        return [f for f in files if f.is_file()]
-    if directories:
-        files = []
+            roots.setdefault(d, mapping["file_pattern"])
+    elif directories:
         for d in directories:
-            dir_path = project_root / d
-            if not dir_path.exists():
-                continue
             for mapping in COLLECTION_MAPPINGS.values():
                 if d in mapping["directories"]:
-                    files.extend(dir_path.rglob(mapping["file_pattern"]))
+                    roots.setdefault(d, mapping["file_pattern"])
                     break
-        return [f for f in files if f.is_file()]
-    # All context files
-    files = []
-    for mapping in COLLECTION_MAPPINGS.values():
-        for d in mapping["directories"]:
-            dir_path = project_root / d
-            if dir_path.exists():
-                files.extend(dir_path.rglob(mapping["file_pattern"]))
-    return [f for f in files if f.is_file()]
+    else:
+        # All context files
+        for mapping in COLLECTION_MAPPINGS.values():
+            for d in mapping["directories"]:
+                roots.setdefault(d, mapping["file_pattern"])
+    files: List[Path] = []
+    for d, file_pattern in roots.items():
+        files.extend(walk_context_files(project_root / d, file_pattern))
+    return files
 
 
 def list_changed_documents(
@@ -166,22 +346,20 @@ def list_changed_documents(
     store = load_fingerprint_store(project_root)
     files_to_check = _collect_context_files(project_root, collection_name, directories)
 
-    changed_or_new: List[str] = []
-    seen_paths = set()
+    # One store load for all files; keys are posix relative paths, as written by reindex
+    entries: Dict[str, Path] = {}
     for f in files_to_check:
-        rel = str(f.relative_to(project_root))
-        if rel in seen_paths:
-            continue
-        seen_paths.add(rel)
-        result = has_document_changed(project_root, rel, f)
-        if result["changed"]:
-            changed_or_new.append(rel)
-
-    deleted: List[str] = []
-    for stored_path in store:
-        full = project_root / stored_path
-        if not full.exists():
-            deleted.append(stored_path)
+        entries.setdefault(f.relative_to(project_root).as_posix(), f)
+    results = _changes_against_store(store, list(entries.items()))
+    changed_or_new = [rel for rel, result in results.items() if result["changed"]]
+
+    # Files just collected exist; only stored paths outside this scan (other scopes, knowledge
+    # packages) or no longer found need a filesystem check
+    deleted = [
+        stored_path
+        for stored_path in store
+        if stored_path not in entries and not (project_root / stored_path).exists()
+    ]
 
     return {"changed_or_new": sorted(changed_or_new), "deleted": sorted(deleted)}
 
@@ -189,6 +367,38 @@ def list_changed_documents(
 # --- Concrete implementation of FingerprintStore (low coupling) ---
 
 
+class _PendingFingerprints:
+    """FingerprintWriter that only collects fingerprints; JsonFingerprintStore.batch() saves them."""
+
+    def __init__(self) -> None:
+        # Hashed on arrival so pending content is not kept in memory
+        self.fingerprints: Dict[str, str] = {}
+        self.file_stats: Dict[str, Tuple[int, int]] = {}
+        # Stats of files found unchanged, refreshed on their existing entries
+        self.unchanged_stats: Dict[str, Tuple[int, int]] = {}
+
+    def update(self, file_path: str, content: bytes) -> None:
+        self.fingerprints[file_path] = compute_fingerprint(content)
+        self.file_stats.pop(file_path, None)
+
+    def update_many(
+        self,
+        contents: Dict[str, bytes],
+        file_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> None:
+        file_stats = file_stats or {}
+        for file_path, content in contents.items():
+            self.fingerprints[file_path] = compute_fingerprint(content)
+            file_stat = file_stats.get(file_path)
+            if file_stat is not None:
+                self.file_stats[file_path] = file_stat
+            else:
+                self.file_stats.pop(file_path, None)
+
+    def update_stats(self, file_stats: Dict[str, Tuple[int, int]]) -> None:
+        self.unchanged_stats.update(file_stats)
+
+
 class JsonFingerprintStore:
     """JSON-backed implementation of FingerprintStore protocol."""
 
@@ -198,6 +408,24 @@ class JsonFingerprintStore:
     def update(self, file_path: str, content: bytes) -> None:
         update_fingerprint(self._project_root, file_path, content=content)
 
+    def update_many(
+        self,
+        contents: Dict[str, bytes],
+        file_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> None:
+        update_fingerprints(self._project_root, contents, file_stats)
+
+    @contextmanager
+    def batch(self) -> Iterator[FingerprintWriter]:
+        pending = _PendingFingerprints()
+        try:
+            yield pending
+        finally:
+            # Saved even if the block fails: every update recorded so far was indexed
+            _save_fingerprints(
+                self._project_root, pending.fingerprints, pending.file_stats, pending.unchanged_stats
+            )
+
     def has_changed(
         self,
         file_path: str,
@@ -207,6 +435,12 @@ class JsonFingerprintStore:
             self._project_root, file_path, file_system_path=file_system_path
         )
 
+    def has_changed_many(
+        self,
+        entries: List[Tuple[str, Path]],
+    ) -> Dict[str, Dict[str, Any]]:
+        return have_documents_changed(self._project_root, entries)
+
     def list_changed(
         self,
         collection_name: Optional[str] = None,
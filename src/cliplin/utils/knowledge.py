@@ -1,20 +1,29 @@
 """
-Knowledge package utilities: cliplin.yaml knowledge section, path normalization, git clone + sparse checkout.
+Knowledge package utilities: cliplin.yaml knowledge section, path normalization, shared git source cache + archive extraction.
 See docs/rules/knowledge-packages.md and docs/adrs/005-knowledge-packages.md.
 """
 
+import copy
+import json
 import re
 import shutil
 import subprocess
+import tarfile
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+# LibYAML-backed loader/dumper when PyYAML was built with it; same safe semantics either way
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 CONFIG_FILENAME = "cliplin.yaml"
 
-# Paths to materialize in a knowledge package repo (sparse checkout). Same semantics as project docs.
-SPARSE_PATHS = [
+# Paths to materialize from a single-package repo (multi-package repos use the <name>/ folder). Same semantics as project docs.
+PACKAGE_CONTENT_PATHS = [
     "docs/adrs",
     "docs/business",
     "docs/features",
@@ -29,6 +38,16 @@ SPARSE_PATHS = [
     "templates",
 ]
 
+# Separators replaced by "-" when turning a source into a directory name
+_SOURCE_SEPARATORS_PATTERN = re.compile(r"[:/\\]+")
+
+# Versions that look like (abbreviated) commit ids: servers do not serve abbreviated ids, so these
+# are resolved in the source cache, fetching history when needed
+_COMMIT_ID_PATTERN = re.compile(r"[0-9a-f]{7,40}")
+
+# Safe extraction (no absolute paths, links outside target, device files) where tarfile supports it
+_TAR_EXTRACT_KWARGS: Dict[str, Any] = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
 
 def get_config_path(project_root: Path) -> Path:
     """Path to cliplin.yaml at project root."""
@@ -36,13 +55,21 @@ def get_config_path(project_root: Path) -> Path:
 
 
 def load_config(project_root: Path) -> Dict[str, Any]:
-    """Load cliplin.yaml; return dict (empty if missing or invalid)."""
+    """Load cliplin.yaml; return dict (empty if missing or invalid). Parses are cached per file version."""
     path = get_config_path(project_root)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return {}
+    return copy.deepcopy(_load_config_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse cliplin.yaml; keyed on (path, mtime, size) so edits invalidate. Callers get deep copies."""
     try:
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
             return dict(data) if isinstance(data, dict) else {}
     except (yaml.YAMLError, OSError):
         return {}
@@ -53,7 +80,11 @@ def save_config(project_root: Path, config: Dict[str, Any]) -> None:
     path = get_config_path(project_root)
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(config, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(
+            config, f, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True, sort_keys=False
+        )
+    # A rewrite within the same mtime tick and size would otherwise hit a stale entry
+    _load_config_cached.cache_clear()
 
 
 def get_knowledge_packages(config: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -73,9 +104,8 @@ def add_knowledge_package_to_config(
 ) -> Dict[str, Any]:
     """Return new config with package appended to knowledge list. Does not mutate config."""
     out = dict(config)
-    knowledge = list(get_knowledge_packages(config))
     # Remove existing entry with same name
-    knowledge = [e for e in knowledge if e["name"] != name]
+    knowledge = [e for e in get_knowledge_packages(config) if e["name"] != name]
     knowledge.append({"name": name, "source": source, "version": version})
     out["knowledge"] = knowledge
     return out
@@ -94,7 +124,7 @@ def normalize_source(source: str) -> str:
     Normalize source string for use in directory name: safe on Windows and Unix.
     Replace ':' and '/' with '-'. Example: github:something/cross-knowledge/commons -> github-something-cross-knowledge-commons.
     """
-    return re.sub(r"[:/\\]+", "-", source).strip("-")
+    return _SOURCE_SEPARATORS_PATTERN.sub("-", source).strip("-")
 
 
 def get_package_dir_name(name: str, source: str) -> str:
@@ -129,34 +159,100 @@ def source_to_git_url(source: str) -> Optional[str]:
     return None
 
 
-def _flatten_package_subfolder(pkg_path: Path, name: str) -> None:
+def get_git_cache_root(project_root: Path) -> Path:
+    """Path to .cliplin/cache/git/ (shared bare repositories, one per source)."""
+    return project_root / ".cliplin" / "cache" / "git"
+
+
+def get_source_cache_path(project_root: Path, source: str) -> Path:
+    """Path to the shared bare repository for a source (reused by every package and version of that source)."""
+    return get_git_cache_root(project_root) / f"{normalize_source(source)}.git"
+
+
+def fetch_source(project_root: Path, source: str, version: str) -> Tuple[Path, str]:
+    """
+    Ensure the shared bare, blob-less repository for source contains version.
+    First use clones it; later calls fetch only version. Branches and tags are fetched shallow
+    (depth 1: only the tip commit and its trees). Commit ids (possibly abbreviated) already in the
+    cache are resolved without fetching; otherwise, unless the remote has a ref of that name, they are
+    fetched with history so they can be resolved.
+    Returns (cache path, revision): the object id version resolved to, which stays valid across later
+    fetches (reusable for several packages) and identifies the content for the reindex state.
+    Callers must not run two fetches for the same source concurrently (FETCH_HEAD is per repository).
+    """
+    url = source_to_git_url(source)
+    if not url:
+        raise ValueError(f"Unsupported source format: {source}. Use github:owner/repo or a Git URL.")
+    cache_path = get_source_cache_path(project_root, source)
+    cached = (cache_path / "HEAD").exists()
+    if _COMMIT_ID_PATTERN.fullmatch(version):
+        revision = _resolve_cached_commit(cache_path, version) if cached else None
+        if revision is not None:
+            return cache_path, revision
+        # Hex-looking branch and tag names (e.g. 20240101, deadbeef) are refs, not commit ids
+        if not _run_git(["ls-remote", url, version], cwd=project_root).strip():
+            return cache_path, _fetch_commit(project_root, url, cache_path, version, cached)
+    if cached:
+        _run_git(
+            ["-C", str(cache_path), "fetch", "--filter=blob:none", "--depth=1", "origin", version],
+            capture_stdout=False,
+        )
+        # First FETCH_HEAD line: "<object id>\t\t<description>"; pin it instead of the moving FETCH_HEAD
+        fetch_head = (cache_path / "FETCH_HEAD").read_text(encoding="utf-8")
+        return cache_path, fetch_head.split(None, 1)[0]
+    _clone_source(project_root, url, cache_path, ["--depth=1", "--branch", version])
+    return cache_path, _run_git(["-C", str(cache_path), "rev-parse", "--verify", version]).strip()
+
+
+def _clone_source(project_root: Path, url: str, cache_path: Path, args: List[str]) -> None:
+    """Create the bare, blob-less source cache at cache_path (extra clone args, e.g. --depth)."""
+    if cache_path.exists():
+        # Leftover from an interrupted clone
+        shutil.rmtree(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    _run_git(
+        ["clone", "--bare", "--filter=blob:none"] + args + [url, str(cache_path)],
+        cwd=project_root,
+        capture_stdout=False,
+    )
+
+
+def _resolve_cached_commit(cache_path: Path, version: str) -> Optional[str]:
     """
-    Move contents of pkg_path/name/ to pkg_path/ so the package root holds the
-    subfolder content (multi-package repo: name identifies the subfolder).
-    Cleans the package root first (except .git and the name subfolder) so that
-    a previous flatten (e.g. old adr/) is removed before moving the new content.
+    Full id of the commit version names in the source cache, or None if it is not there or is the
+    name of a cached ref (a branch or tag is fetched again instead of served stale).
     """
-    subfolder = pkg_path / name
-    if not subfolder.is_dir():
-        return
-    # Remove any existing content at package root except .git and the subfolder
-    # (leftover from a previous flatten, e.g. adr/ after repo renamed to adrs/)
-    for item in pkg_path.iterdir():
-        if item.name == ".git" or item.name == name:
-            continue
-        if item.is_dir():
-            shutil.rmtree(item)
-        else:
-            item.unlink()
-    for item in subfolder.iterdir():
-        dest = pkg_path / item.name
-        if dest.exists():
-            if dest.is_dir():
-                shutil.rmtree(dest)
-            else:
-                dest.unlink()
-        shutil.move(str(item), str(pkg_path))
-    subfolder.rmdir()
+    try:
+        refs = _run_git(
+            ["-C", str(cache_path), "for-each-ref", "--format=%(refname)"]
+            + ["refs/heads/" + version, "refs/tags/" + version]
+        )
+        if refs.strip():
+            return None
+        revision = _run_git(
+            ["-C", str(cache_path), "rev-parse", "--verify", "--quiet", version + "^{commit}"]
+        ).strip()
+    except subprocess.CalledProcessError:
+        return None
+    return revision or None
+
+
+def _fetch_commit(project_root: Path, url: str, cache_path: Path, version: str, cached: bool) -> str:
+    """
+    Bring commit id version into the source cache and return its full id. Servers only fetch refs
+    and full ids by name, so all branches and tags are fetched with history (unshallowing the cache
+    if needed) and version is resolved locally.
+    """
+    if cached:
+        unshallow = ["--unshallow"] if (cache_path / "shallow").exists() else []
+        _run_git(
+            ["-C", str(cache_path), "fetch", "--filter=blob:none"] + unshallow
+            + ["origin", "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"],
+            capture_stdout=False,
+        )
+    else:
+        _clone_source(project_root, url, cache_path, [])
+    return _run_git(["-C", str(cache_path), "rev-parse", "--verify", version + "^{commit}"]).strip()
 
 
 def clone_package(
@@ -164,92 +260,111 @@ def clone_package(
     name: str,
     source: str,
     version: str,
+    fetched: Optional[Tuple[Path, str]] = None,
 ) -> Path:
     """
-    Clone the repository for the package with sparse checkout into .cliplin/knowledge/<name>-<source_normalized>.
-    Multi-package repo: sparse checkout only <name>/ then flatten so package root = content of repo/<name>/.
-    Single-package repo: if no top-level <name>/ folder, sparse checkout standard paths (docs/adrs, etc.).
-    Returns the path to the package directory.
+    Materialize the package into .cliplin/knowledge/<name>-<source_normalized> from the shared source cache.
+    Multi-package repo: only <name>/ is extracted, with its content at the package root.
+    Single-package repo: if no top-level <name>/ folder, the standard context paths (docs/adrs, etc.) are extracted.
+    The package directory holds plain files (no .git). fetched: result of fetch_source for this
+    source and version, when already fetched for another package. Returns the path to the package directory.
     """
+    cache_path, revision = fetched or fetch_source(project_root, source, version)
     pkg_path = get_package_path(project_root, name, source)
-    if pkg_path.exists():
-        shutil.rmtree(pkg_path)
-    get_knowledge_root(project_root).mkdir(parents=True, exist_ok=True)
-
-    url = source_to_git_url(source)
-    if not url:
-        raise ValueError(f"Unsupported source format: {source}. Use github:owner/repo or a Git URL.")
-
-    # Clone with no checkout to avoid downloading everything
-    subprocess.run(
-        ["git", "clone", "--filter=blob:none", "--no-checkout", url, str(pkg_path)],
-        check=True,
-        capture_output=True,
-        text=True,
-        cwd=project_root,
-    )
-    subprocess.run(
-        ["git", "-C", str(pkg_path), "sparse-checkout", "init", "--no-cone"],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    # Prefer multi-package layout: only the subfolder matching the package name
-    subprocess.run(
-        ["git", "-C", str(pkg_path), "sparse-checkout", "set", name],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    subprocess.run(
-        ["git", "-C", str(pkg_path), "checkout", version],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    name_dir = pkg_path / name
-    if name_dir.is_dir() and any(name_dir.iterdir()):
-        _flatten_package_subfolder(pkg_path, name)
-    else:
-        # Single-package repo: no top-level name folder; materialize root-level context paths
-        if name_dir.exists():
-            shutil.rmtree(name_dir)
-        subprocess.run(
-            ["git", "-C", str(pkg_path), "sparse-checkout", "set"] + SPARSE_PATHS,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        subprocess.run(
-            ["git", "-C", str(pkg_path), "checkout", version],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
+    _materialize_package(cache_path, revision, name, pkg_path)
     return pkg_path
 
 
-def update_package_checkout(project_root: Path, name: str, source: str, version: str) -> Path:
-    """Fetch and checkout the given version in the existing package directory. Re-flatten if multi-package layout."""
+def update_package_checkout(
+    project_root: Path,
+    name: str,
+    source: str,
+    version: str,
+    fetched: Optional[Tuple[Path, str]] = None,
+) -> Path:
+    """
+    Fetch the given version into the source cache (unless already fetched) and re-materialize the
+    existing package directory.
+    """
     pkg_path = get_package_path(project_root, name, source)
     if not pkg_path.exists():
         raise FileNotFoundError(f"Package directory not found: {pkg_path}")
-    subprocess.run(
-        ["git", "-C", str(pkg_path), "fetch", "origin", version],
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    subprocess.run(
-        ["git", "-C", str(pkg_path), "checkout", version],
+    cache_path, revision = fetched or fetch_source(project_root, source, version)
+    _materialize_package(cache_path, revision, name, pkg_path)
+    return pkg_path
+
+
+def _materialize_package(cache_path: Path, treeish: str, name: str, pkg_path: Path) -> None:
+    """
+    Extract the package's paths at treeish into pkg_path via 'git archive' (missing blobs are fetched
+    in one batch). Content is staged next to pkg_path and swapped in, so a failure keeps the old content.
+    """
+    listed = _run_git(
+        ["-C", str(cache_path), "ls-tree", treeish, "--", name] + PACKAGE_CONTENT_PATHS
+    ).splitlines()
+    # ls-tree lines: "<mode> <type> <object>\t<path>"
+    trees = {line.split("\t", 1)[1] for line in listed if line.split(" ", 2)[1:2] == ["tree"]}
+    if name in trees:
+        paths, strip_prefix = [name], name + "/"
+    else:
+        paths, strip_prefix = [p for p in PACKAGE_CONTENT_PATHS if p in trees], ""
+
+    staging = pkg_path.with_name(pkg_path.name + ".tmp")
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+    try:
+        if paths:
+            _extract_archive(cache_path, treeish, paths, strip_prefix, staging)
+        if pkg_path.exists():
+            shutil.rmtree(pkg_path)
+        staging.rename(pkg_path)
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging)
+
+
+def _extract_archive(
+    cache_path: Path, treeish: str, paths: List[str], strip_prefix: str, target: Path
+) -> None:
+    """Stream 'git archive' for paths into target, dropping strip_prefix from member names."""
+    cmd = ["git", "-C", str(cache_path), "archive", "--format=tar", treeish, "--"] + paths
+    # stderr goes to a temp file so a chatty git cannot block on a full pipe while stdout is read
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as archive:
+                for member in archive:
+                    if strip_prefix:
+                        if not member.name.startswith(strip_prefix):
+                            continue
+                        member.name = member.name[len(strip_prefix):]
+                    if not member.name:
+                        continue
+                    archive.extract(member, target, **_TAR_EXTRACT_KWARGS)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", errors="replace")
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+
+
+def _run_git(args: List[str], cwd: Optional[Path] = None, capture_stdout: bool = True) -> str:
+    """
+    Run a git command and return stdout ("" when capture_stdout is False: output is discarded, not
+    read); raises subprocess.CalledProcessError (with stderr) on failure.
+    """
+    return subprocess.run(
+        ["git"] + args,
         check=True,
-        capture_output=True,
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
-    )
-    name_dir = pkg_path / name
-    if name_dir.is_dir() and any(name_dir.iterdir()):
-        _flatten_package_subfolder(pkg_path, name)
-    return pkg_path
+        encoding="utf-8",
+        cwd=cwd,
+    ).stdout or ""
 
 
 def remove_package_directory(project_root: Path, name: str, source: str) -> None:
@@ -259,24 +374,45 @@ def remove_package_directory(project_root: Path, name: str, source: str) -> None
         shutil.rmtree(pkg_path)
 
 
+def get_reindex_state_path(project_root: Path) -> Path:
+    """Path to the JSON map of package directory name -> revision last materialized and reindexed."""
+    return project_root / ".cliplin" / "cache" / "reindex-state.json"
+
+
+def load_reindex_state(project_root: Path) -> Dict[str, str]:
+    """Load the reindex state (empty if missing or invalid)."""
+    path = get_reindex_state_path(project_root)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_reindex_state(project_root: Path, state: Dict[str, str]) -> None:
+    """Persist the reindex state."""
+    path = get_reindex_state_path(project_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def remove_source_cache(project_root: Path, source: str) -> None:
+    """Remove the shared bare repository for source (when no configured package uses it any more)."""
+    cache_path = get_source_cache_path(project_root, source)
+    if cache_path.exists():
+        shutil.rmtree(cache_path)
+
+
 def find_package_by_name(
     project_root: Path, name: str
 ) -> Optional[Dict[str, str]]:
     """
-    Find a knowledge package by name: first in config, then by matching installed directory.
-    Returns dict with name, source, version (version may be empty if only found on disk).
+    Find a knowledge package by name in config. Returns dict with name, source, version, or None.
+    Installed directories are not scanned: .cliplin/knowledge/<name>-<source_normalized> only holds the
+    normalized source, so the exact source cannot be recovered from disk; remove/update require config.
     """
     config = load_config(project_root)
     for pkg in get_knowledge_packages(config):
         if pkg["name"] == name:
             return pkg
-    # Check installed dirs: .cliplin/knowledge/<name>-*
-    knowledge_root = get_knowledge_root(project_root)
-    if not knowledge_root.exists():
-        return None
-    for d in knowledge_root.iterdir():
-        if d.is_dir() and d.name.startswith(name + "-"):
-            # Recover source from dir name: name-source_normalized -> source is lost, we only have normalized
-            # So we cannot recover exact source from disk. Require config for remove/update when we need source.
-            return None
     return None
@@ -1,8 +1,9 @@
 """Template management utilities."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import yaml
 from rich.console import Console
@@ -68,12 +69,9 @@ This project uses Cliplin for AI-assisted development driven by specifications.
     console.print(f"  [green]✓[/green] Created README.md")
 
 
-def create_framework_adr(target_dir: Path) -> None:
-    """Create ADR about the Cliplin Framework."""
-    adr_path = target_dir / "docs" / "adrs" / "000-cliplin-framework.md"
-    adr_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    adr_content = """# ADR-000: Cliplin Framework Overview
+def get_framework_adr_content() -> str:
+    """Get the content for docs/adrs/000-cliplin-framework.md (ADR about the Cliplin Framework)."""
+    return """# ADR-000: Cliplin Framework Overview
 
 ## Status
 Accepted
@@ -172,17 +170,11 @@ Every output must be traceable back to a specification.
 - AI assistants should query this ADR and related context files before starting any work
 - All specifications must be kept up to date and properly indexed
 """
-    
-    adr_path.write_text(adr_content, encoding="utf-8")
-    console.print(f"  [green]✓[/green] Created docs/adrs/000-cliplin-framework.md")
 
 
-def create_rules_format_adr(target_dir: Path) -> None:
-    """Create ADR about the Rules format and usage."""
-    adr_path = target_dir / "docs" / "adrs" / "001-rules-format.md"
-    adr_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    adr_content = """# ADR-001: Rules Format and Usage
+def get_rules_format_adr_content() -> str:
+    """Get the content for docs/adrs/001-rules-format.md (ADR about the Rules format and usage)."""
+    return """# ADR-001: Rules Format and Usage
 
 ## Status
 Accepted
@@ -260,17 +252,11 @@ summary: "Validate data at controllers; internal services assume data validity."
 - This ADR should be indexed in the context store collection `business-and-architecture`
 - When creating new `.md` rules files, follow the structure and naming conventions described here
 """
-    
-    adr_path.write_text(adr_content, encoding="utf-8")
-    console.print(f"  [green]✓[/green] Created docs/adrs/001-rules-format.md")
 
 
-def create_ui_intent_format_adr(target_dir: Path) -> None:
-    """Create ADR about UI Intent format and usage."""
-    adr_path = target_dir / "docs" / "adrs" / "002-ui-intent-format.md"
-    adr_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    adr_content = """# ADR-002: UI Intent Schema Format and Usage
+def get_ui_intent_format_adr_content() -> str:
+    """Get the content for docs/adrs/002-ui-intent-format.md (ADR about UI Intent format and usage)."""
+    return """# ADR-002: UI Intent Schema Format and Usage
 
 ## Status
 Accepted
@@ -426,17 +412,11 @@ annotations:
 - When creating new UI Intent files, follow the schema structure described here
 - UI Intent focuses on intent, not visual design details
 """
-    
-    adr_path.write_text(adr_content, encoding="utf-8")
-    console.print(f"  [green]✓[/green] Created docs/adrs/002-ui-intent-format.md")
-
 
-def create_knowledge_packages_adr(target_dir: Path) -> None:
-    """Create ADR about Knowledge Packages so AI and users have visibility of the command and usage."""
-    adr_path = target_dir / "docs" / "adrs" / "005-knowledge-packages.md"
-    adr_path.parent.mkdir(parents=True, exist_ok=True)
 
-    adr_content = """# ADR-005: Knowledge Packages (Cliplin as Knowledge Package Manager)
+def get_knowledge_packages_adr_content() -> str:
+    """Get the content for docs/adrs/005-knowledge-packages.md (ADR about Knowledge Packages, so AI and users have visibility of the command and usage)."""
+    return """# ADR-005: Knowledge Packages (Cliplin as Knowledge Package Manager)
 
 ## Status
 Accepted
@@ -451,7 +431,7 @@ This project uses Cliplin and can depend on **knowledge packages**: external rep
 
 - **CLI command**: `cliplin knowledge` with subcommands: `list`, `add`, `remove`, `update`, `show`, `install`.
 - **Configuration**: Package list is declared in `cliplin.yaml` at project root under the top-level key `knowledge` (list of entries with `name`, `source`, `version`).
-- **Installation**: Packages live under `.cliplin/knowledge/<name>-<source_normalized>/`. Content is obtained via git sparse checkout; in multi-package repos the package **name** selects which top-level subfolder to install.
+- **Installation**: Packages live under `.cliplin/knowledge/<name>-<source_normalized>/`. Content is extracted with `git archive` from a shared bare clone per source (`.cliplin/cache/git/`); in multi-package repos the package **name** selects which top-level subfolder to install.
 
 ### Subcommands (summary)
 
@@ -477,8 +457,28 @@ For detailed usage, configuration format, multi-package vs single-package repos,
 - Indexed in the context store collection `business-and-architecture`.
 """
 
-    adr_path.write_text(adr_content, encoding="utf-8")
-    console.print(f"  [green]✓[/green] Created docs/adrs/005-knowledge-packages.md")
+
+# Framework context ADRs created by `cliplin init`: (path relative to project root, content getter)
+FRAMEWORK_ADRS: List[Tuple[str, Callable[[], str]]] = [
+    ("docs/adrs/000-cliplin-framework.md", get_framework_adr_content),
+    ("docs/adrs/001-rules-format.md", get_rules_format_adr_content),
+    ("docs/adrs/002-ui-intent-format.md", get_ui_intent_format_adr_content),
+    ("docs/adrs/005-knowledge-packages.md", get_knowledge_packages_adr_content),
+]
+UI_INTENT_ADR_PATH = "docs/adrs/002-ui-intent-format.md"
+
+
+def create_framework_adrs(target_dir: Path, include_ui_intent: bool = True) -> None:
+    """Write the framework context ADRs in one batch (one mkdir, one console print).
+    The UI Intent ADR is skipped when include_ui_intent is False (ui-intent tool not enabled)."""
+    (target_dir / "docs" / "adrs").mkdir(parents=True, exist_ok=True)
+    created = []
+    for rel_path, get_content in FRAMEWORK_ADRS:
+        if rel_path == UI_INTENT_ADR_PATH and not include_ui_intent:
+            continue
+        (target_dir / rel_path).write_text(get_content(), encoding="utf-8")
+        created.append(rel_path)
+    console.print("\n".join(f"  [green]✓[/green] Created {rel_path}" for rel_path in created))
 
 
 def create_cursor_mcp_config(target_dir: Path) -> None:
@@ -562,6 +562,9 @@ def create_claude_desktop_mcp_config(target_dir: Path) -> None:
         json.dump(existing_config, f, indent=2, ensure_ascii=False)
 
 
+# Host rule templates below are shared by the AI host integrations (and the Claude Desktop
+# instructions embed four of them); they are immutable strings, so each is built once
+@lru_cache(maxsize=None)
 def get_cursor_context_content() -> str:
     """Get the content for .cursor/rules/context.mdc"""
     return """---
@@ -645,6 +648,7 @@ When any context file is created or modified, you MUST:
 """
 
 
+@lru_cache(maxsize=None)
 def get_feature_first_flow_content() -> str:
     """Get the content for feature-first-flow rule (Cursor .mdc and Claude .md). Same content for both hosts."""
     return """---
@@ -676,6 +680,7 @@ See also: `docs/business/framework.md` (section "Feature-first flow"), `docs/adr
 """
 
 
+@lru_cache(maxsize=None)
 def get_cursor_feature_processing_content() -> str:
     """Get the content for .cursor/rules/feature-processing.mdc"""
     return """---
@@ -889,6 +894,7 @@ Scenario: User login with OAuth
 """
 
 
+@lru_cache(maxsize=None)
 def get_cursor_context_protocol_loading_content() -> str:
     """Get the content for .cursor/rules/context-protocol-loading.mdc"""
     return """---
@@ -1072,6 +1078,7 @@ This protocol is **MANDATORY** and must be followed before:
 """
 
 
+@lru_cache(maxsize=None)
 def get_claude_desktop_instructions_content() -> str:
     """Get the consolidated instructions content for Claude Desktop."""
     context_content = get_cursor_context_content()
@@ -1108,6 +1115,7 @@ This file contains all the rules and protocols that Claude should follow when wo
 """
 
 
+@lru_cache(maxsize=None)
 def get_claude_desktop_claude_md_content() -> str:
     """Get the claude.md content for Claude Desktop directory."""
     return """# Claude Desktop Configuration for Cliplin
@@ -0,0 +1,139 @@
+"""
+Shared fixtures for knowledge package tests: a local git remote reached through url.insteadOf
+(sources like acme/kb resolve to file:// repositories) and an in-memory context store.
+"""
+
+import io
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+from rich.console import Console
+
+from cliplin.commands import knowledge as knowledge_command
+
+SOURCE = "acme/kb"
+
+
+class FakeContextStore:
+    """In-memory ContextStore covering the calls made by reindex and the knowledge commands."""
+
+    def __init__(self, fail_upserts: bool = False) -> None:
+        self.fail_upserts = fail_upserts
+        # collection name -> document id -> metadata
+        self.collections: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def is_initialized(self) -> bool:
+        return True
+
+    def ensure_collections(self) -> List[str]:
+        return []
+
+    def get_existing_document_ids(self, collection_name: str, ids: List[str]) -> List[str]:
+        docs = self.collections.get(collection_name, {})
+        return [doc_id for doc_id in ids if doc_id in docs]
+
+    def upsert_documents(
+        self,
+        collection_name: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        if self.fail_upserts:
+            raise RuntimeError("embedding model unavailable")
+        docs = self.collections.setdefault(collection_name, {})
+        for i, doc_id in enumerate(ids):
+            docs[doc_id] = metadatas[i] if metadatas else {}
+
+    def get_documents(
+        self,
+        collection_name: str,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        items = sorted(self.collections.get(collection_name, {}).items())
+        items = items[offset or 0:]
+        if limit is not None:
+            items = items[:limit]
+        return {"ids": [doc_id for doc_id, _ in items], "metadatas": [meta for _, meta in items]}
+
+    def delete_documents(self, collection_name: str, ids: List[str]) -> None:
+        docs = self.collections.get(collection_name, {})
+        for doc_id in ids:
+            docs.pop(doc_id, None)
+
+    def document_ids(self) -> List[str]:
+        return sorted(doc_id for docs in self.collections.values() for doc_id in docs)
+
+
+class KnowledgeRepoTestCase(unittest.TestCase):
+    """
+    Provides self.project (an initialized project, also the cwd), a work repository self.work and
+    its bare remote, published as SOURCE. Git runs with an isolated global config.
+    """
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+        gitconfig = self.tmp / "gitconfig"
+        gitconfig.write_text(
+            f'[url "file://{(self.tmp / "remote").as_posix()}/"]\n'
+            "\tinsteadOf = https://github.com/\n"
+            "[user]\n\tname = Test\n\temail = test@example.com\n"
+            "[init]\n\tdefaultBranch = main\n",
+            encoding="utf-8",
+        )
+        env = mock.patch.dict(
+            os.environ, {"GIT_CONFIG_GLOBAL": str(gitconfig), "GIT_CONFIG_NOSYSTEM": "1"}
+        )
+        env.start()
+        self.addCleanup(env.stop)
+
+        self.remote = self.tmp / "remote" / f"{SOURCE}.git"
+        self.remote.parent.mkdir(parents=True)
+        self.git("init", "-q", "--bare", str(self.remote), cwd=self.tmp)
+        self.work = self.tmp / "work"
+        self.git("init", "-q", str(self.work), cwd=self.tmp)
+        self.git("remote", "add", "origin", str(self.remote))
+
+        self.project = self.tmp / "project"
+        (self.project / ".cliplin").mkdir(parents=True)
+        (self.project / "cliplin.yaml").write_text("knowledge: []\n", encoding="utf-8")
+        cwd = os.getcwd()
+        os.chdir(self.project)
+        self.addCleanup(os.chdir, cwd)
+
+    def git(self, *args: str, cwd: Optional[Path] = None) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=cwd or self.work, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    def commit(self, files: Dict[str, str], message: str) -> str:
+        """Write files (relative path -> content) in the work repository, commit, and return the commit id."""
+        for rel, content in files.items():
+            path = self.work / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        self.git("add", "-A")
+        self.git("commit", "-q", "-m", message)
+        return self.git("rev-parse", "HEAD")
+
+    def push(self, *refs: str) -> None:
+        self.git("push", "-q", "origin", *refs)
+
+    def run_command(self, store: FakeContextStore, command: Callable[..., None], *args: Any) -> None:
+        """Run a knowledge command against store, discarding its console output."""
+        with mock.patch.object(knowledge_command, "get_context_store", return_value=store), \
+                mock.patch.object(knowledge_command, "console", Console(file=io.StringIO())):
+            command(*args)
@@ -0,0 +1,29 @@
+"""Tests for the ChromaDB-backed ContextStore."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cliplin.utils.chromadb import ChromaDBContextStore
+
+
+class GetExistingDocumentIdsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = ChromaDBContextStore(Path(tmp.name))
+
+    def test_missing_collection_has_no_documents(self) -> None:
+        self.assertEqual(self.store.get_existing_document_ids("missing", ["docs/rules/a.md"]), [])
+
+    def test_lookup_failure_propagates(self) -> None:
+        client = mock.Mock()
+        client.get_collection.return_value.get.side_effect = RuntimeError("lookup failed")
+        with mock.patch.object(self.store, "_client_or_raise", return_value=client):
+            with self.assertRaises(RuntimeError):
+                self.store.get_existing_document_ids("rules", ["docs/rules/a.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
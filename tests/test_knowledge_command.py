@@ -0,0 +1,52 @@
+"""Tests for the knowledge add/update/install commands and the reindex state they record."""
+
+import shutil
+import unittest
+
+from cliplin.commands import knowledge as knowledge_command
+from cliplin.utils.knowledge import get_package_path, load_reindex_state
+
+from knowledge_fixtures import SOURCE, FakeContextStore, KnowledgeRepoTestCase
+
+
+class ReindexStateTest(KnowledgeRepoTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.revision = self.commit({"kb/rules/a.md": "# a\n", "kb/adrs/b.md": "# b\n"}, "one")
+        self.push("main")
+        self.pkg_path = get_package_path(self.project, "kb", SOURCE)
+
+    def test_failed_reindex_does_not_record_revision(self) -> None:
+        failing = FakeContextStore(fail_upserts=True)
+        self.run_command(failing, knowledge_command.knowledge_add_command, "kb", SOURCE, "main")
+        self.assertTrue((self.pkg_path / "rules" / "a.md").is_file())
+        self.assertNotIn(self.pkg_path.name, load_reindex_state(self.project))
+
+        # The next install indexes the package again instead of skipping it as unchanged
+        store = FakeContextStore()
+        self.run_command(store, knowledge_command.knowledge_install_command, False)
+        prefix = f".cliplin/knowledge/{self.pkg_path.name}/"
+        self.assertEqual(store.document_ids(), [prefix + "adrs/b.md", prefix + "rules/a.md"])
+        self.assertEqual(load_reindex_state(self.project)[self.pkg_path.name], self.revision)
+
+    def test_failed_reindex_clears_recorded_revision(self) -> None:
+        self.run_command(FakeContextStore(), knowledge_command.knowledge_add_command, "kb", SOURCE, "main")
+        self.assertEqual(load_reindex_state(self.project)[self.pkg_path.name], self.revision)
+
+        self.commit({"kb/rules/c.md": "# c\n"}, "two")
+        self.push("main")
+        failing = FakeContextStore(fail_upserts=True)
+        self.run_command(failing, knowledge_command.knowledge_install_command, False)
+        self.assertNotIn(self.pkg_path.name, load_reindex_state(self.project))
+
+    def test_install_restores_emptied_package_directory(self) -> None:
+        self.run_command(FakeContextStore(), knowledge_command.knowledge_add_command, "kb", SOURCE, "main")
+        shutil.rmtree(self.pkg_path)
+        self.pkg_path.mkdir()
+
+        self.run_command(FakeContextStore(), knowledge_command.knowledge_install_command, False)
+        self.assertTrue((self.pkg_path / "rules" / "a.md").is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+"""Tests for the shared git source cache and package extraction, and the commands built on them."""
+
+import unittest
+from unittest import mock
+
+from cliplin.commands import knowledge as knowledge_command
+from cliplin.utils import knowledge
+from cliplin.utils.knowledge import (
+    clone_package,
+    fetch_source,
+    get_package_path,
+    get_source_cache_path,
+    load_config,
+    update_package_checkout,
+)
+
+from knowledge_fixtures import SOURCE, FakeContextStore, KnowledgeRepoTestCase
+
+
+class FetchSourceTest(KnowledgeRepoTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.first = self.commit({"kb/rules/a.md": "# a\n"}, "one")
+        self.push("main")
+
+    def test_clone_creates_bare_cache(self) -> None:
+        cache_path, revision = fetch_source(self.project, SOURCE, "main")
+        self.assertEqual(cache_path, get_source_cache_path(self.project, SOURCE))
+        self.assertTrue((cache_path / "HEAD").is_file())
+        self.assertEqual(self.git("rev-parse", "--is-bare-repository", cwd=cache_path), "true")
+        self.assertEqual(revision, self.first)
+
+    def test_fetch_into_existing_cache_returns_new_tip(self) -> None:
+        fetch_source(self.project, SOURCE, "main")
+        second = self.commit({"kb/rules/b.md": "# b\n"}, "two")
+        self.push("main")
+        _, revision = fetch_source(self.project, SOURCE, "main")
+        self.assertEqual(revision, second)
+
+    def test_full_commit_id(self) -> None:
+        self.commit({"kb/rules/b.md": "# b\n"}, "two")
+        self.push("main")
+        _, revision = fetch_source(self.project, SOURCE, self.first)
+        self.assertEqual(revision, self.first)
+
+
+class FetchVersionTest(KnowledgeRepoTestCase):
+    """Branches and tags are fetched shallow; commit ids fall back to fetching history."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.first = self.commit({"kb/rules/a.md": "# a\n"}, "one")
+        self.git("tag", "v1")
+        self.second = self.commit({"kb/rules/b.md": "# b\n"}, "two")
+        self.push("main", "v1")
+        self.cache_path = get_source_cache_path(self.project, SOURCE)
+
+    def is_shallow(self) -> bool:
+        return (self.cache_path / "shallow").exists()
+
+    def test_branch_is_fetched_shallow(self) -> None:
+        _, revision = fetch_source(self.project, SOURCE, "main")
+        self.assertEqual(revision, self.second)
+        self.assertTrue(self.is_shallow())
+
+    def test_tag_is_fetched_shallow(self) -> None:
+        _, revision = fetch_source(self.project, SOURCE, "v1")
+        self.assertEqual(revision, self.first)
+        self.assertTrue(self.is_shallow())
+        # Tag fetched into an existing cache
+        fetch_source(self.project, SOURCE, "main")
+        self.assertEqual(fetch_source(self.project, SOURCE, "v1")[1], self.first)
+
+    def test_abbreviated_commit_id_without_cache(self) -> None:
+        _, revision = fetch_source(self.project, SOURCE, self.first[:8])
+        self.assertEqual(revision, self.first)
+
+    def test_abbreviated_commit_id_in_shallow_cache(self) -> None:
+        fetch_source(self.project, SOURCE, "main")
+        # Not reachable at depth 1: history is fetched and the cache unshallowed
+        _, revision = fetch_source(self.project, SOURCE, self.first[:8])
+        self.assertEqual(revision, self.first)
+        self.assertFalse(self.is_shallow())
+        # Already in the cache: resolved without fetching
+        with mock.patch.object(knowledge, "_fetch_commit") as fetch_commit:
+            self.assertEqual(fetch_source(self.project, SOURCE, self.second[:10])[1], self.second)
+        fetch_commit.assert_not_called()
+
+    def test_hex_looking_branch_and_tag_are_refs(self) -> None:
+        self.git("branch", "deadbeef", self.first)
+        self.git("tag", "20240101", self.second)
+        self.push("deadbeef", "20240101")
+        self.assertEqual(fetch_source(self.project, SOURCE, "deadbeef")[1], self.first)
+        self.assertTrue(self.is_shallow())
+        self.assertEqual(fetch_source(self.project, SOURCE, "20240101")[1], self.second)
+
+        # A moved branch is fetched again, not resolved from the cached ref
+        self.git("checkout", "-q", "deadbeef")
+        moved = self.commit({"kb/rules/c.md": "# c\n"}, "three")
+        self.push("deadbeef")
+        self.assertEqual(fetch_source(self.project, SOURCE, "deadbeef")[1], moved)
+
+
+class MaterializePackageTest(KnowledgeRepoTestCase):
+    def test_multi_package_repo_extracts_name_folder(self) -> None:
+        self.commit({"kb/rules/a.md": "# a\n", "other/rules/o.md": "# o\n", "README.md": "x\n"}, "one")
+        self.push("main")
+        pkg_path = clone_package(self.project, "kb", SOURCE, "main")
+        extracted = sorted(p.relative_to(pkg_path).as_posix() for p in pkg_path.rglob("*"))
+        self.assertEqual(extracted, ["rules", "rules/a.md"])
+
+    def test_single_package_repo_extracts_context_paths(self) -> None:
+        self.commit({"docs/rules/a.md": "# a\n", "skills/s/SKILL.md": "# s\n", "src/x.py": "x\n"}, "one")
+        self.push("main")
+        pkg_path = clone_package(self.project, "kb", SOURCE, "main")
+        self.assertTrue((pkg_path / "docs" / "rules" / "a.md").is_file())
+        self.assertTrue((pkg_path / "skills" / "s" / "SKILL.md").is_file())
+        self.assertFalse((pkg_path / "src").exists())
+
+    def test_update_replaces_content(self) -> None:
+        self.commit({"kb/rules/a.md": "# a\n"}, "one")
+        self.push("main")
+        pkg_path = clone_package(self.project, "kb", SOURCE, "main")
+        self.git("rm", "-q", "kb/rules/a.md")
+        self.commit({"kb/rules/b.md": "# b\n"}, "two")
+        self.push("main")
+        update_package_checkout(self.project, "kb", SOURCE, "main")
+        self.assertEqual(sorted(p.name for p in (pkg_path / "rules").iterdir()), ["b.md"])
+
+    def test_failed_extraction_keeps_previous_content(self) -> None:
+        self.commit({"kb/rules/a.md": "# a\n"}, "one")
+        self.push("main")
+        pkg_path = clone_package(self.project, "kb", SOURCE, "main")
+        self.commit({"kb/rules/b.md": "# b\n"}, "two")
+        self.push("main")
+        with mock.patch.object(knowledge, "_extract_archive", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                update_package_checkout(self.project, "kb", SOURCE, "main")
+        self.assertEqual(sorted(p.name for p in (pkg_path / "rules").iterdir()), ["a.md"])
+        self.assertFalse(pkg_path.with_name(pkg_path.name + ".tmp").exists())
+
+
+class KnowledgeCommandsTest(KnowledgeRepoTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.commit({"kb/rules/a.md": "# a\n", "kt/rules/t.md": "# t\n"}, "one")
+        self.push("main")
+        self.kb_path = get_package_path(self.project, "kb", SOURCE)
+        self.kt_path = get_package_path(self.project, "kt", SOURCE)
+        self.store = FakeContextStore()
+        self.run_command(self.store, knowledge_command.knowledge_add_command, "kb", SOURCE, "main")
+        self.run_command(self.store, knowledge_command.knowledge_add_command, "kt", SOURCE, "main")
+
+    def indexed(self) -> list:
+        return self.store.document_ids()
+
+    def doc_id(self, pkg_path, rel: str) -> str:
+        return f".cliplin/knowledge/{pkg_path.name}/{rel}"
+
+    def test_add_indexes_packages(self) -> None:
+        expected = [self.doc_id(self.kb_path, "rules/a.md"), self.doc_id(self.kt_path, "rules/t.md")]
+        self.assertEqual(self.indexed(), expected)
+        self.assertEqual([pkg["name"] for pkg in load_config(self.project)["knowledge"]], ["kb", "kt"])
+
+    def test_install_restores_missing_package(self) -> None:
+        knowledge.remove_package_directory(self.project, "kb", SOURCE)
+        self.run_command(self.store, knowledge_command.knowledge_install_command, False)
+        self.assertTrue((self.kb_path / "rules" / "a.md").is_file())
+
+    def test_install_force_reextracts_and_reindexes(self) -> None:
+        (self.kb_path / "rules" / "stray.md").write_text("# stray\n", encoding="utf-8")
+        stray_id = self.doc_id(self.kb_path, "rules/stray.md")
+        self.store.collections["rules"][stray_id] = {"file_path": stray_id}
+        self.run_command(self.store, knowledge_command.knowledge_install_command, True)
+        self.assertFalse((self.kb_path / "rules" / "stray.md").exists())
+        self.assertEqual(len(self.indexed()), 2)
+        self.assertFalse(any("stray" in doc_id for doc_id in self.indexed()))
+
+    def test_install_reports_os_error_per_package(self) -> None:
+        clone = knowledge_command.clone_package
+
+        def failing_clone(project_root, name, *args):
+            if name == "kb":
+                raise PermissionError("permission denied")
+            return clone(project_root, name, *args)
+
+        knowledge.remove_package_directory(self.project, "kb", SOURCE)
+        knowledge.remove_package_directory(self.project, "kt", SOURCE)
+        with mock.patch.object(knowledge_command, "clone_package", failing_clone):
+            self.run_command(self.store, knowledge_command.knowledge_install_command, False)
+        self.assertFalse(self.kb_path.exists())
+        self.assertTrue((self.kt_path / "rules" / "t.md").is_file())
+
+    def test_remove_purges_package_and_unused_cache(self) -> None:
+        cache_path = get_source_cache_path(self.project, SOURCE)
+        self.run_command(self.store, knowledge_command.knowledge_remove_command, "kb")
+        self.assertFalse(self.kb_path.exists())
+        self.assertEqual(self.indexed(), [self.doc_id(self.kt_path, "rules/t.md")])
+        self.assertTrue(cache_path.exists())
+
+        self.run_command(self.store, knowledge_command.knowledge_remove_command, "kt")
+        self.assertEqual(self.indexed(), [])
+        self.assertFalse(cache_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for batched reindexing on the preparation thread pool."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cliplin.commands import reindex
+from cliplin.utils.fingerprint import get_fingerprint_store, load_fingerprint_store
+
+from knowledge_fixtures import FakeContextStore
+
+
+class ReindexFilesBatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.project = Path(tmp.name)
+        rules = self.project / "docs" / "rules"
+        rules.mkdir(parents=True)
+        self.files = []
+        for i in range(20):
+            path = rules / f"r{i:02}.md"
+            path.write_text(f"# rule {i}\n", encoding="utf-8")
+            self.files.append(path)
+
+    def test_worker_failure_counts_batch_as_errors(self) -> None:
+        prepare = reindex._prepare_batch
+
+        def failing_prepare(fingerprint_store, files, project_root):
+            if self.files[3] in files:
+                raise RuntimeError("worker failed")
+            return prepare(fingerprint_store, files, project_root)
+
+        store = FakeContextStore()
+        with mock.patch.object(reindex, "_prepare_batch", failing_prepare):
+            stats = reindex.reindex_files_batch(
+                store, get_fingerprint_store(self.project), self.files, self.project, batch_size=1, jobs=4
+            )
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["added"], 19)
+        # Fingerprints of the other batches are still saved
+        self.assertEqual(len(load_fingerprint_store(self.project)), 19)
+        self.assertNotIn("docs/rules/r03.md", load_fingerprint_store(self.project))
+
+    def test_prepared_batches_stay_within_window(self) -> None:
+        prepare = reindex._prepare_batch
+        counts = {"prepared": 0, "applied": 0, "ahead": 0}
+
+        def counting_prepare(fingerprint_store, files, project_root):
+            prepared = prepare(fingerprint_store, files, project_root)
+            counts["prepared"] += 1
+            return prepared
+
+        def on_progress(_: int) -> None:
+            counts["ahead"] = max(counts["ahead"], counts["prepared"] - counts["applied"])
+            counts["applied"] += 1
+
+        jobs = 2
+        with mock.patch.object(reindex, "_prepare_batch", counting_prepare):
+            reindex.reindex_files_batch(
+                FakeContextStore(),
+                get_fingerprint_store(self.project),
+                self.files,
+                self.project,
+                batch_size=1,
+                on_progress=on_progress,
+                jobs=jobs,
+            )
+        self.assertEqual(counts["applied"], len(self.files))
+        self.assertLessEqual(counts["ahead"], 2 * jobs)
+
+
+if __name__ == "__main__":
+    unittest.main()